@@ -5,27 +5,80 @@ Handles file comparison and statistics calculation.
 """
 
 import os
+from types import MappingProxyType
+
+
+# Shared read-only default for dict.get() lookups, avoids allocating a new {} per miss
+_EMPTY_MAP = MappingProxyType({})
+
+
+def _intersect_count(a, b):
+    """Count keys present in both collections, iterating over the smaller one"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(1 for key in a if key in b)
+
+
+def _normalize_value(value, case_sensitive, norm_cache=None):
+    """Normalize value based on case sensitivity setting
+    
+    norm_cache is an optional dict reused across one comparison run so
+    repeated values are only stripped/lowered once. It must not be shared
+    between runs with different case_sensitive settings.
+    """
+    if norm_cache is not None:
+        normalized = norm_cache.get(value)
+        if normalized is None:
+            normalized = _normalize_value(value, case_sensitive)
+            norm_cache[value] = normalized
+        return normalized
+    if not case_sensitive:
+        # str.lower already has an ASCII fast path; encoding to bytes and using
+        # bytes.translate measured slower and would mix bytes/str normalized values
+        return value.strip().lower() if value else ''
+    return value.strip() if value else ''
+
+
+def _values_differ(val1, val2, include_empty, case_sensitive, norm_cache=None):
+    """Compare two values based on settings"""
+    # If include_empty is False, skip comparison if either value is empty
+    if not include_empty:
+        if not val1 or not val2:
+            return False
+    # Identical raw values never differ, skip normalization
+    if val1 == val2:
+        return False
+    # Compare normalized values
+    if norm_cache is not None:
+        norm = _normalize_value
+        return norm(val1, case_sensitive, norm_cache) != norm(val2, case_sensitive, norm_cache)
+    stripped1 = val1.strip() if val1 else ''
+    stripped2 = val2.strip() if val2 else ''
+    if case_sensitive:
+        return stripped1 != stripped2
+    # Lowercasing never changes the length of ASCII text
+    if len(stripped1) != len(stripped2) and stripped1.isascii() and stripped2.isascii():
+        return True
+    return stripped1.lower() != stripped2.lower()
+
+
+def _check_always(term_value):
+    """Check every value regardless of the term customizer value"""
+    return True
+
+
+def _make_should_check(require_value):
+    """Return a one-argument should_check_value specialized for require_value"""
+    # Only check if term customizer value exists
+    return bool if require_value else _check_always
 
 
 class ComparisonLogic:
     """Handles comparison logic and statistics"""
     
-    @staticmethod
-    def normalize_value(value, case_sensitive):
-        """Normalize value based on case sensitivity setting"""
-        if not case_sensitive:
-            return value.strip().lower() if value else ''
-        return value.strip() if value else ''
-    
-    @staticmethod
-    def values_differ(val1, val2, include_empty, case_sensitive):
-        """Compare two values based on settings"""
-        # If include_empty is False, skip comparison if either value is empty
-        if not include_empty:
-            if not val1 or not val2:
-                return False
-        # Compare normalized values
-        return ComparisonLogic.normalize_value(val1, case_sensitive) != ComparisonLogic.normalize_value(val2, case_sensitive)
+    normalize_value = staticmethod(_normalize_value)
+    values_differ = staticmethod(_values_differ)
+    make_should_check = staticmethod(_make_should_check)
     
     @staticmethod
     def should_check_value(term_value, require_value):
@@ -40,8 +93,18 @@ class ComparisonLogic:
     @staticmethod
     def calculate_statistics(crowdin_data, term_customizer_file_data, mismatched_entries, 
                            mismatched_entries_per_file, term_customizer_files, xliff_source_language, 
-                           xliff_target_language, term_customizer_locales):
-        """Calculate comparison statistics"""
+                           xliff_target_language, term_customizer_locales, basenames=None,
+                           crowdin_keys=None, term_customizer_file_keys=None,
+                           mismatched_count_per_file=None, all_term_keys=None):
+        """Calculate comparison statistics
+        
+        basenames ({file_path: basename}), crowdin_keys (set of all Crowdin keys)
+        and term_customizer_file_keys ({file_path: frozenset of keys}) are optional
+        precomputed structures maintained by the caller as files are loaded; they
+        are derived from the data here when not given. mismatched_count_per_file
+        ({file_path: count}) likewise replaces len() of the per-file mismatches,
+        and all_term_keys (union of all Term Customizer keys) the per-call union.
+        """
         stats = {
             'total_crowdin_keys': len(crowdin_data),
             'total_term_customizer_keys': 0,
@@ -54,39 +117,54 @@ class ComparisonLogic:
             'per_file_stats': {}
         }
         
-        # Get all unique keys from term customizer
-        all_term_keys = set()
-        for file_path, file_data in term_customizer_file_data.items():
-            all_term_keys.update(file_data.keys())
+        if crowdin_keys is None:
+            crowdin_keys = crowdin_data.keys()
+        
+        # Get all unique keys from term customizer and per-file key sets in one pass
+        build_term_keys = all_term_keys is None
+        if build_term_keys:
+            all_term_keys = set()
+        file_keys_by_path = {}
+        in_crowdin_by_path = {}
+        for file_path in term_customizer_files:
+            file_keys = None
+            if term_customizer_file_keys is not None:
+                file_keys = term_customizer_file_keys.get(file_path)
+            if file_keys is None:
+                file_keys = term_customizer_file_data.get(file_path, _EMPTY_MAP).keys()
+            if build_term_keys:
+                all_term_keys.update(file_keys)
+            file_keys_by_path[file_path] = file_keys
+            in_crowdin_by_path[file_path] = _intersect_count(file_keys, crowdin_keys)
         
         stats['total_term_customizer_keys'] = len(all_term_keys)
         
         # Calculate keys in both
-        crowdin_keys = set(crowdin_data.keys())
-        stats['keys_in_both'] = len(crowdin_keys & all_term_keys)
-        stats['keys_only_in_crowdin'] = len(crowdin_keys - all_term_keys)
-        keys_only_in_term = all_term_keys - crowdin_keys
-        stats['keys_only_in_term_customizer'] = len(keys_only_in_term)
+        stats['keys_in_both'] = _intersect_count(crowdin_keys, all_term_keys)
+        stats['keys_only_in_crowdin'] = len(crowdin_keys) - stats['keys_in_both']
+        stats['keys_only_in_term_customizer'] = len(all_term_keys) - stats['keys_in_both']
         
         # Calculate matching keys (in both but no mismatches)
-        keys_in_both = set(crowdin_data.keys()) & all_term_keys
-        stats['matching_keys'] = max(0, len(keys_in_both) - stats['mismatched_keys'])
+        stats['matching_keys'] = max(0, stats['keys_in_both'] - stats['mismatched_keys'])
         
         # Per-file statistics
+        if basenames is None:
+            basenames = {file_path: os.path.basename(file_path) for file_path in term_customizer_files}
         for file_path in term_customizer_files:
-            file_data = term_customizer_file_data.get(file_path, {})
-            file_mismatches = mismatched_entries_per_file.get(file_path, {})
-            file_keys = set(file_data.keys())
-            
-            keys_in_crowdin = len(file_keys & set(crowdin_data.keys()))
+            if mismatched_count_per_file is not None:
+                mismatch_count = mismatched_count_per_file.get(file_path, 0)
+            else:
+                mismatch_count = len(mismatched_entries_per_file.get(file_path, _EMPTY_MAP))
+            file_keys = file_keys_by_path[file_path]
+            keys_in_crowdin = in_crowdin_by_path[file_path]
             file_stats = {
                 'total_keys': len(file_keys),
                 'keys_in_crowdin': keys_in_crowdin,
-                'keys_only_in_file': len(file_keys - set(crowdin_data.keys())),
-                'mismatched_keys': len(file_mismatches),
-                'matching_keys': max(0, keys_in_crowdin - len(file_mismatches))
+                'keys_only_in_file': len(file_keys) - keys_in_crowdin,
+                'mismatched_keys': mismatch_count,
+                'matching_keys': max(0, keys_in_crowdin - mismatch_count)
             }
-            stats['per_file_stats'][os.path.basename(file_path)] = file_stats
+            stats['per_file_stats'][basenames[file_path]] = file_stats
         
         return stats
 
@@ -5,7 +5,43 @@ Handles loading and saving of user configuration.
 """
 
 import os
-import json
+
+import json_compat
+from constants import DEFAULT_API_ENDPOINT, DEFAULT_API_MODEL
+
+
+# Default values for every configuration field
+_CONFIG_DEFAULTS = {
+    'crowdin_file_paths': [],  # List of file paths (backward compatible with single file)
+    'api_endpoint': DEFAULT_API_ENDPOINT,
+    'api_key': '',
+    'api_model': DEFAULT_API_MODEL,
+}
+
+
+def filter_existing_paths(paths):
+    """Return the paths that exist, listing each parent directory only once"""
+    paths_by_dir = {}
+    for path in paths:
+        paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+    
+    existing = set()
+    for directory, dir_paths in paths_by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            # Directory can't be listed, check the paths one by one
+            existing.update(path for path in dir_paths if os.path.exists(path))
+            continue
+        existing.update(path for path in dir_paths if os.path.basename(path) in names)
+    
+    # Keep the original order
+    return [path for path in paths if path in existing]
+
+
+# Parsed config per file, reused while the file is unchanged: {path: ((mtime_ns, size), config)}
+_config_cache = {}
 
 
 class ConfigManager:
@@ -13,38 +49,47 @@ class ConfigManager:
     
     def __init__(self):
         self.config_file = os.path.join(os.path.expanduser("~"), ".decidim_translation_customizer.json")
-        self.crowdin_file_paths = []  # List of file paths (backward compatible with single file)
-        self.api_endpoint = 'https://api.openai.com/v1/chat/completions'
-        self.api_key = ''
-        self.api_model = 'gpt-4o-mini'
+        self._reset_defaults()
+    
+    def _reset_defaults(self):
+        """Reset all configuration fields to their defaults"""
+        for name, value in _CONFIG_DEFAULTS.items():
+            # Copy lists so instances never share (and mutate) the default
+            setattr(self, name, list(value) if isinstance(value, list) else value)
     
     def load(self):
         """Load saved configuration"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    # Support both old format (single file) and new format (multiple files)
-                    if 'crowdin_file_paths' in config:
-                        # New format: multiple files
-                        self.crowdin_file_paths = [
-                            path for path in config['crowdin_file_paths']
-                            if os.path.exists(path)
-                        ]
-                    elif 'crowdin_file_path' in config:
-                        # Old format: single file (backward compatibility)
-                        if os.path.exists(config['crowdin_file_path']):
-                            self.crowdin_file_paths = [config['crowdin_file_path']]
-                    # Load API settings
-                    self.api_endpoint = config.get('api_endpoint', 'https://api.openai.com/v1/chat/completions')
-                    self.api_key = config.get('api_key', '')
-                    self.api_model = config.get('api_model', 'gpt-4o-mini')
+            try:
+                stat = os.stat(self.config_file)
+            except OSError:
+                return
+            
+            # Only re-read and re-parse the file when it changed since the last load
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = _config_cache.get(self.config_file)
+            if cached is not None and cached[0] == signature:
+                config = cached[1]
+            else:
+                with open(self.config_file, 'rb') as f:
+                    config = json_compat.loads(f.read())
+                _config_cache[self.config_file] = (signature, config)
+            
+            # Support both old format (single file) and new format (multiple files)
+            if 'crowdin_file_paths' in config:
+                # New format: multiple files
+                self.crowdin_file_paths = filter_existing_paths(config['crowdin_file_paths'])
+            elif 'crowdin_file_path' in config:
+                # Old format: single file (backward compatibility)
+                if os.path.exists(config['crowdin_file_path']):
+                    self.crowdin_file_paths = [config['crowdin_file_path']]
+            # Load API settings
+            self.api_endpoint = config.get('api_endpoint', _CONFIG_DEFAULTS['api_endpoint'])
+            self.api_key = config.get('api_key', _CONFIG_DEFAULTS['api_key'])
+            self.api_model = config.get('api_model', _CONFIG_DEFAULTS['api_model'])
         except Exception as e:
             # If config file is corrupted, just ignore it
-            self.crowdin_file_paths = []
-            self.api_endpoint = 'https://api.openai.com/v1/chat/completions'
-            self.api_key = ''
-            self.api_model = 'gpt-4o-mini'
+            self._reset_defaults()
     
     def save(self):
         """Save configuration"""
@@ -55,8 +100,11 @@ class ConfigManager:
                 'api_key': self.api_key,
                 'api_model': self.api_model
             }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temporary file and swap it in, so the config is never left half-written
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(json_compat.dumps_bytes(config, indent=True))
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             # Silently fail if we can't save config
             pass
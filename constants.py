@@ -7,10 +7,16 @@ DEFAULT_API_ENDPOINT = 'https://api.openai.com/v1/chat/completions'
 DEFAULT_API_MODEL = 'gpt-4o-mini'
 DEFAULT_BATCH_SIZE = 10
 DEFAULT_TEMPERATURE = 0.1
+LLM_MAX_PARALLEL_REQUESTS = 4  # Batches sent to the API at the same time
+LLM_MAX_BATCH_TOKENS = 2000  # Estimated prompt tokens per batch, long texts get smaller batches than Batch Size
+# Client-side budget per minute, kept under the provider limits instead of running into HTTP 429
+LLM_REQUESTS_PER_MINUTE = 500
+LLM_TOKENS_PER_MINUTE = 200000
 
 # UI Strings
 APP_TITLE = "Decidim Translation Assistant"
 DEFAULT_WINDOW_SIZE = "1400x900"
+VIRTUAL_CHECKLIST_THRESHOLD = 50  # File lists longer than this use a scrolling, lazily built checklist
 
 # File types
 XLIFF_EXTENSIONS = [("XLIFF files", "*.xliff"), ("All files", "*.*")]
@@ -42,4 +48,7 @@ FONT_COURIER = ("Courier", 10)
 FONT_ARIAL = ("Arial", 11)
 FONT_ARIAL_BOLD = ("Arial", 11, "bold")
 FONT_ARIAL_HEADER = ("Arial", 12, "bold")
+FONT_BOLD = "DecidimBold"  # Named font, registered once by DecidimTranslationGUI._init_fonts
+FONT_STATS_BOLD = "DecidimStatsBold"  # Named FONT_ARIAL_BOLD, registered by _init_fonts
+FONT_STATS_HEADER = "DecidimStatsHeader"  # Named FONT_ARIAL_HEADER, registered by _init_fonts
 
@@ -4,6 +4,10 @@ Data Model for Decidim Translation Assistant
 Manages application state and data structures.
 """
 
+import os
+import sys
+from collections import deque
+
 
 class DataModel:
     """Manages application data state"""
@@ -16,31 +20,74 @@ class DataModel:
         # File data
         self.crowdin_file_data = {}  # Data per XLIFF file: {file_path: {key: {'source': value, 'target': value}}}
         self.crowdin_languages = {}  # Languages per XLIFF file: {file_path: {'source': 'en', 'target': 'de'}}
+        self.crowdin_languages_lower = {}  # {file_path: (source, target)} lowercased and interned for comparisons
+        self.crowdin_keys = set()  # All keys across loaded XLIFF files
         self.term_customizer_data = {}  # Combined data from all files
         self.term_customizer_file_data = {}  # Data per file: {file_path: {key: {locale: value}}}
+        self.term_customizer_file_keys = {}  # Keys per file: {file_path: frozenset}
+        self.term_customizer_file_locales = {}  # Locales per file: {file_path: frozenset}
+        self.all_term_keys = set()  # Union of keys across all Term Customizer files
+        self._basename_cache = {}  # {file_path: basename} for Term Customizer files
         
         # Comparison results
         self.mismatched_entries = {}
         self.mismatched_entries_per_file = {}  # {file_path: {key: entry}}
+        self.mismatched_count_per_file = {}  # {file_path: number of mismatched keys}
         self.term_customizer_locales = set()
-        self.keys_to_delete = []  # Keys that exist only in Term Customizer
+        self.keys_to_delete = set()  # Keys that exist only in Term Customizer
         
         # Grammar check and tone adjustment data
         self.grammar_corrections = {}  # {file_path: {key: {locale: {'original': value, 'corrected': value}}}}
         self.tone_corrections = {}  # {file_path: {key: {locale: {'original': value, 'corrected': value}}}}
+        self.grammar_correction_counts = {}  # {file_path: number of grammar corrections}
+        self.tone_correction_counts = {}  # {file_path: number of tone adjustments}
         self.gc_direct_files = {}  # {file_path: {key: {locale: value}}} - Files loaded directly for grammar check
+        self.gc_direct_file_locales = {}  # {file_path: frozenset of locales} for gc_direct_files
         
         # Search & Replace data
         self.sr_direct_files = {}  # {file_path: {key: {locale: value}}} - Files loaded directly for search/replace
-        self.replacement_preview = {}  # {file_path: {key: {locale: {'old': value, 'new': value}}}}
-        self.last_sr_output_files = []  # List of most recently created output files
+        self.sr_direct_file_locales = {}  # {file_path: frozenset of locales} for sr_direct_files
+        self.replacement_preview_rows = []  # [(file_path, key, locale, old_value, new_value)]
+        self.replacement_preview_index = {}  # {file_path: [row indices]}
+        self.last_sr_output_files = deque(maxlen=10)  # Most recently created output files
+    
+    def add_term_customizer_file(self, file_path, file_data, file_locales):
+        """Add a loaded Term Customizer file and its data"""
+        if file_path not in self.term_customizer_files:
+            self.term_customizer_files.append(file_path)
+            self._basename_cache[file_path] = os.path.basename(file_path)
+        for key, locales in file_data.items():
+            self.term_customizer_data.setdefault(key, {}).update(locales)
+        self.term_customizer_locales.update(file_locales)
+        self.term_customizer_file_data[file_path] = file_data
+        self.term_customizer_file_locales[file_path] = frozenset(file_locales)
+        file_keys = frozenset(file_data)
+        self.term_customizer_file_keys[file_path] = file_keys
+        self.all_term_keys |= file_keys
+    
+    def add_crowdin_file(self, file_path, data, source_lang, target_lang):
+        """Add a loaded XLIFF file and its data"""
+        if file_path not in self.crowdin_files:
+            self.crowdin_files.append(file_path)
+        self.crowdin_file_data[file_path] = data
+        self.crowdin_languages[file_path] = {
+            'source': source_lang,
+            'target': target_lang
+        }
+        self.crowdin_languages_lower[file_path] = (sys.intern((source_lang or '').lower()),
+                                                   sys.intern((target_lang or '').lower()))
+        self.crowdin_keys.update(data)
     
     def clear_term_customizer_files(self):
         """Clear all Term Customizer files and related data"""
-        self.term_customizer_files = []
-        self.term_customizer_data = {}
-        self.term_customizer_file_data = {}
-        self.term_customizer_locales = set()
+        self.term_customizer_files.clear()
+        self._basename_cache.clear()
+        self.term_customizer_data.clear()
+        self.term_customizer_file_data.clear()
+        self.term_customizer_file_keys.clear()
+        self.term_customizer_file_locales.clear()
+        self.all_term_keys.clear()
+        self.term_customizer_locales.clear()
     
     def clear_crowdin_file(self, file_path):
         """Remove a Crowdin file and its data"""
@@ -50,15 +97,23 @@ class DataModel:
             del self.crowdin_file_data[file_path]
         if file_path in self.crowdin_languages:
             del self.crowdin_languages[file_path]
+        self.crowdin_languages_lower.pop(file_path, None)
+        # Keys can be shared between files, so rebuild from the remaining ones
+        self.crowdin_keys.clear()
+        for file_data in self.crowdin_file_data.values():
+            self.crowdin_keys.update(file_data)
     
     def clear_comparison_results(self):
         """Clear comparison results"""
-        self.mismatched_entries = {}
-        self.mismatched_entries_per_file = {}
-        self.keys_to_delete = []
+        self.mismatched_entries.clear()
+        self.mismatched_entries_per_file.clear()
+        self.mismatched_count_per_file.clear()
+        self.keys_to_delete.clear()
     
     def clear_grammar_results(self):
         """Clear grammar check and tone adjustment results"""
-        self.grammar_corrections = {}
-        self.tone_corrections = {}
+        self.grammar_corrections.clear()
+        self.tone_corrections.clear()
+        self.grammar_correction_counts.clear()
+        self.tone_correction_counts.clear()
 
@@ -3,22 +3,95 @@ Decidim Translation Assistant
 """
 
 import csv
+import hashlib
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from tkinter.font import Font
 import os
-import json
+from operator import itemgetter
 import re
+import sys
+import time
 from datetime import datetime
-import urllib.request
-import urllib.error
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 # Import modules (lazy import for heavy modules)
-from config_manager import ConfigManager
+import json_compat
+from config_manager import ConfigManager, filter_existing_paths
 from file_handlers import FileHandler
 from comparison_logic import ComparisonLogic
 from search_replace import SearchReplaceHandler
-from views import CompareView, EditView, SearchReplaceView, GrammarCheckView
+from views import CompareView, EditView, SearchReplaceView, GrammarCheckView, VirtualChecklist
+from constants import (
+    FONT_BOLD, FONT_STATS_BOLD, FONT_STATS_HEADER, FONT_ARIAL_BOLD, FONT_ARIAL_HEADER,
+    VIRTUAL_CHECKLIST_THRESHOLD, LLM_MAX_PARALLEL_REQUESTS, LLM_MAX_BATCH_TOKENS
+)
+
+# Characters outside the Basic Multilingual Plane (e.g. emoji)
+_NON_BMP_RE = re.compile('[\U00010000-\U0010FFFF]')
+
+# Parts of a value that are not words: placeholders, URLs, e-mail addresses and markup
+_NON_WORD_PARTS_RE = re.compile(r'%\{[^}]*\}|\{[^}]*\}|%[0-9]*\$?[sd]|https?://\S+|\S+@\S+\.\w+|<[^>]*>')
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Minimum seconds between grammar progress redraws
+_PROGRESS_FLUSH_INTERVAL = 0.1
+
+# Shared read-only default for dict.get() lookups, avoids allocating a new {} per miss
+_EMPTY_MAP = MappingProxyType({})
+
+
+def _split_entries(entries):
+    """Split non-empty [(key, value)] into parallel ([keys], [values]) lists"""
+    keys, values = zip(*entries)
+    return list(keys), list(values)
+
+
+def _has_text(value):
+    """Whether value has a letter outside placeholders, URLs and markup"""
+    if not _LETTER_RE.search(value):
+        return False
+    return _LETTER_RE.search(_NON_WORD_PARTS_RE.sub('', value)) is not None
+
+
+def _pack_batches(values, max_count, max_tokens):
+    """Split values into batches of at most max_count values and about max_tokens prompt tokens
+    
+    A value over the token budget on its own still gets a batch of its own.
+    """
+    batches = []
+    batch = []
+    batch_tokens = 0
+    for value in values:
+        tokens = len(value) // 4 + 5  # About 4 characters per token, plus numbering and line break
+        if batch and (len(batch) >= max_count or batch_tokens + tokens > max_tokens):
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(value)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _merged_corrections(grammar_corrections, tone_corrections):
+    """Yield (key, locale, original, corrected) of one file, tone adjustments applied on top of grammar corrections"""
+    for key, locales in grammar_corrections.items():
+        tone_locales = tone_corrections.get(key, _EMPTY_MAP)
+        for locale, changes in locales.items():
+            # The grammar original is kept, the tone adjustment replaces the grammar correction
+            tone_changes = tone_locales.get(locale)
+            yield key, locale, changes['original'], (changes if tone_changes is None else tone_changes)['corrected']
+        for locale, changes in tone_locales.items():
+            if locale not in locales:
+                yield key, locale, changes['original'], changes['corrected']
+    for key, locales in tone_corrections.items():
+        if key not in grammar_corrections:
+            for locale, changes in locales.items():
+                yield key, locale, changes['original'], changes['corrected']
 
 # Lazy import for grammar_tone (only when needed)
 _grammar_tone_handler = None
@@ -31,6 +104,27 @@ def get_grammar_tone_handler():
         _grammar_tone_handler = GrammarToneHandler
     return _grammar_tone_handler
 
+# Shared worker pool for background I/O (created on first use)
+_background_executor = None
+
+def get_background_executor():
+    """Return the shared worker pool for background tasks"""
+    global _background_executor
+    if _background_executor is None:
+        _background_executor = ThreadPoolExecutor(max_workers=4)
+    return _background_executor
+
+# Persistent LLM answer cache (opened on first use)
+_llm_answer_cache = None
+
+def get_llm_answer_cache():
+    """Return the LLM answer cache shared across sessions"""
+    global _llm_answer_cache
+    if _llm_answer_cache is None:
+        from llm_cache import LLMAnswerCache
+        _llm_answer_cache = LLMAnswerCache()
+    return _llm_answer_cache
+
 
 class DecidimTranslationGUI:
     def __init__(self, root):
@@ -43,12 +137,28 @@ class DecidimTranslationGUI:
         self.term_customizer_files = []  # List of file paths
         self.crowdin_file_data = {}  # Data per XLIFF file: {file_path: {key: {'source': value, 'target': value}}}
         self.crowdin_languages = {}  # Languages per XLIFF file: {file_path: {'source': 'en', 'target': 'de'}}
+        self.crowdin_languages_lower = {}  # {file_path: (source, target)} lowercased and interned for comparisons
+        self.crowdin_keys = set()  # All keys across loaded XLIFF files
+        self._crowdin_version = 0  # Bumped whenever XLIFF files are loaded or removed
+        self._combined_crowdin_cache = None
+        self._combined_crowdin_version = -1
         self.term_customizer_data = {}  # Combined data from all files
         self.term_customizer_file_data = {}  # Data per file: {file_path: {key: {locale: value}}}
+        self.term_customizer_file_keys = {}  # Keys per file: {file_path: frozenset}
+        self.term_customizer_file_locales = {}  # Locales per file: {file_path: frozenset}
+        self.all_term_keys = set()  # Union of keys across all Term Customizer files
+        self._basename_cache = {}  # {file_path: basename} for Term Customizer files
+        self._path_parts_cache = {}  # {file_path: (dirname, basename, stem, ext)}, see _path_parts
+        self._virtual_checklists = {}  # {checkboxes frame: VirtualChecklist} for long file lists
+        self._llm_response_cache = {}  # {(endpoint, model, temperature, prompt digest): parsed entries}
+        self._llm_run_active = False  # A grammar check or tone adjustment is waiting for the API
         self.mismatched_entries = {}
         self.mismatched_entries_per_file = {}  # {file_path: {key: entry}}
+        self.mismatched_count_per_file = {}  # {file_path: number of mismatched keys}
         self.term_customizer_locales = set()
-        self.keys_to_delete = []  # Keys that exist only in Term Customizer
+        self.keys_to_delete = set()  # Keys that exist only in Term Customizer
+        self._keys_to_delete_signature = None  # (crowdin version, term version) keys_to_delete was built for
+        self._term_version = 0  # Bumped whenever Term Customizer files are loaded or cleared
         
         # Initialize config manager
         self.config_manager = ConfigManager()
@@ -66,32 +176,53 @@ class DecidimTranslationGUI:
         # Grammar check and tone adjustment data
         self.grammar_corrections = {}  # {file_path: {key: {locale: {'original': value, 'corrected': value}}}}
         self.tone_corrections = {}  # {file_path: {key: {locale: {'original': value, 'corrected': value}}}}
+        self.grammar_correction_counts = {}  # {file_path: number of grammar corrections}
+        self.tone_correction_counts = {}  # {file_path: number of tone adjustments}
         self.gc_direct_files = {}  # {file_path: {key: {locale: value}}} - Files loaded directly for grammar check
+        self.gc_direct_file_locales = {}  # {file_path: frozenset of locales} for gc_direct_files
         
         # Cache for language lists to avoid repeated expensive operations
-        self._sr_languages_cache = None
-        self._sr_languages_cache_valid = False
-        self._gc_languages_cache = None
-        self._gc_languages_cache_valid = False
+        self._sr_applied_languages = None  # Memoized list last shown in the combo
+        self._sr_languages_memo = {}  # {(selected XLIFF files, selected term files): sorted languages}
+        self._gc_applied_languages = None  # Memoized list last shown in the combo
+        self._gc_languages_memo = {}  # {selected term files: sorted languages}
         
         # Load saved configuration
         self.config_manager.load()
-        self.crowdin_files = self.config_manager.crowdin_file_paths.copy()
+        # File paths key several per-file maps, intern them once
+        self.crowdin_files = [sys.intern(path) for path in self.config_manager.crowdin_file_paths]
         self.api_endpoint = self.config_manager.api_endpoint
         self.api_key = self.config_manager.api_key
         self.api_model = self.config_manager.api_model
         
         # Create UI
+        self._init_fonts()
         self.create_widgets()
         
-        # Auto-load Crowdin files if available and update listbox
-        for file_path in self.crowdin_files:
-            if os.path.exists(file_path):
-                self.load_crowdin_file(file_path)
+        # Auto-load Crowdin files in the background so the window can paint first
+        self._pending_crowdin_loads = {}  # {file_path: Future}
+        # One directory listing per parent folder instead of a stat() per file
+        for file_path in filter_existing_paths(self.crowdin_files):
+            if os.path.splitext(file_path)[1].lower() == '.xliff':
+                self._pending_crowdin_loads[file_path] = get_background_executor().submit(
+                    self.file_handler.load_xliff_file, file_path)
+            else:
+                self.load_crowdin_file(file_path)  # Reports the unsupported file type
+        if self._pending_crowdin_loads:
+            self.locale_info_label.config(
+                text=f"Loading {len(self._pending_crowdin_loads)} XLIFF file(s)...", foreground="gray")
+            self.root.after(50, self._poll_crowdin_loads)
         
         # Sync listbox with loaded files after UI is created
         self.root.after_idle(self._sync_crowdin_listbox)
         
+    def _init_fonts(self):
+        """Register the shared named fonts once, referenced by name in all tabs and dialogs"""
+        # Keep a reference: the Tcl font is deleted when the Font object is garbage collected
+        self._font_bold = Font(root=self.root, name=FONT_BOLD, weight="bold", exists=False)
+        self._font_stats_bold = Font(root=self.root, name=FONT_STATS_BOLD, font=FONT_ARIAL_BOLD, exists=False)
+        self._font_stats_header = Font(root=self.root, name=FONT_STATS_HEADER, font=FONT_ARIAL_HEADER, exists=False)
+        
     def create_widgets(self):
         # File upload section at the top (always visible)
         upload_frame = ttk.LabelFrame(self.root, text="Load Files to Compare", padding="10")
@@ -171,11 +302,17 @@ class DecidimTranslationGUI:
         self.search_replace_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.search_replace_frame, text="Search & Replace")
         # Don't create view yet - will be created on first access
+        self.search_replace_view = None
         
         # Grammar Check & Tone Adjustments Tab (lazy load)
         self.grammar_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.grammar_frame, text="Grammar check & tone adjustments")
         # Don't create view yet - will be created on first access
+        self.grammar_check_view = None
+        
+        # Pending lazy tab creation (after id) and "Loading..." placeholders per tab
+        self._lazy_init_after_id = None
+        self._lazy_placeholders = {}
     
     def on_tab_changed(self, event=None):
         """Handle tab change event for lazy loading"""
@@ -183,48 +320,81 @@ class DecidimTranslationGUI:
             selected_tab = self.notebook.index(self.notebook.select())
             tab_names = ['compare', 'edit', 'search_replace', 'grammar']
             
+            # Cancel a pending creation if the user already switched away from that tab
+            if self._lazy_init_after_id is not None:
+                self.root.after_cancel(self._lazy_init_after_id)
+                self._lazy_init_after_id = None
+            
             if selected_tab < len(tab_names):
                 tab_name = tab_names[selected_tab]
                 
-                # Lazy initialize Search & Replace tab
-                if tab_name == 'search_replace' and not self.tabs_initialized['search_replace']:
-                    if self.search_replace_view is None:
-                        self.search_replace_view = SearchReplaceView(self.search_replace_frame, self)
-                        self.search_replace_view.create()
-                    self.tabs_initialized['search_replace'] = True
-                
-                # Lazy initialize Grammar Check tab
-                elif tab_name == 'grammar' and not self.tabs_initialized['grammar']:
-                    if self.grammar_check_view is None:
-                        self.grammar_check_view = GrammarCheckView(self.grammar_frame, self)
-                        self.grammar_check_view.create()
-                    self.tabs_initialized['grammar'] = True
+                # Lazy initialize Search & Replace and Grammar Check tabs: show a placeholder
+                # now and build the widgets once Tk has painted the tab
+                if tab_name in ('search_replace', 'grammar') and not self.tabs_initialized[tab_name]:
+                    if tab_name not in self._lazy_placeholders:
+                        frame = self.search_replace_frame if tab_name == 'search_replace' else self.grammar_frame
+                        placeholder = ttk.Label(frame, text="Loading...", foreground="gray")
+                        placeholder.pack(pady=20)
+                        self._lazy_placeholders[tab_name] = placeholder
+                    self._lazy_init_after_id = self.root.after_idle(self._finish_lazy_init, tab_name)
         except:
             pass  # Ignore errors during tab switching
+    
+    def _finish_lazy_init(self, tab_name):
+        """Create a lazily loaded tab view, replacing its placeholder"""
+        self._lazy_init_after_id = None
+        if self.tabs_initialized[tab_name]:
+            return
         
+        placeholder = self._lazy_placeholders.pop(tab_name, None)
+        if placeholder is not None:
+            placeholder.destroy()
+        
+        if tab_name == 'search_replace':
+            if self.search_replace_view is None:
+                self.search_replace_view = SearchReplaceView(self.search_replace_frame, self)
+                self.search_replace_view.create()
+        elif tab_name == 'grammar':
+            if self.grammar_check_view is None:
+                self.grammar_check_view = GrammarCheckView(self.grammar_frame, self)
+                self.grammar_check_view.create()
+        self.tabs_initialized[tab_name] = True
+        
+    def _get_combined_crowdin_data(self):
+        """Return Crowdin data combined from all XLIFF files, rebuilt only when files changed"""
+        if self._combined_crowdin_version == self._crowdin_version:
+            return self._combined_crowdin_cache
+        
+        combined_crowdin_data = {}
+        for file_data in self.crowdin_file_data.values():
+            for key, entry in file_data.items():
+                source = entry.get('source') or ''
+                target = entry.get('target') or ''
+                slot = combined_crowdin_data.get(key)
+                if slot is None:
+                    combined_crowdin_data[key] = {'source': source, 'target': target}
+                    continue
+                # Merge values (prefer non-empty values)
+                if source and not slot['source']:
+                    slot['source'] = source
+                if target and not slot['target']:
+                    slot['target'] = target
+        
+        self._combined_crowdin_cache = combined_crowdin_data
+        self._combined_crowdin_version = self._crowdin_version
+        return combined_crowdin_data
+    
     def calculate_statistics(self):
         """Calculate comparison statistics"""
-        # Build combined Crowdin data from all XLIFF files
-        combined_crowdin_data = {}
+        # Combined Crowdin data from all XLIFF files (cached between calls)
+        combined_crowdin_data = self._get_combined_crowdin_data()
         all_xliff_sources = set()
         all_xliff_targets = set()
-        for file_path, file_data in self.crowdin_file_data.items():
-            langs = self.crowdin_languages[file_path]
+        for langs in self.crowdin_languages.values():
             if langs['source']:
                 all_xliff_sources.add(langs['source'])
             if langs['target']:
                 all_xliff_targets.add(langs['target'])
-            for key, entry in file_data.items():
-                if key not in combined_crowdin_data:
-                    combined_crowdin_data[key] = {
-                        'source': entry.get('source', '') or '',
-                        'target': entry.get('target', '') or ''
-                    }
-                # Merge values (prefer non-empty values)
-                if entry.get('source') and not combined_crowdin_data[key]['source']:
-                    combined_crowdin_data[key]['source'] = entry.get('source', '') or ''
-                if entry.get('target') and not combined_crowdin_data[key]['target']:
-                    combined_crowdin_data[key]['target'] = entry.get('target', '') or ''
         
         # Use first source/target for compatibility (or combine them)
         xliff_source = ', '.join(sorted(all_xliff_sources)) if all_xliff_sources else ''
@@ -233,17 +403,96 @@ class DecidimTranslationGUI:
         stats = self.comparison_logic.calculate_statistics(
             combined_crowdin_data, self.term_customizer_file_data, self.mismatched_entries,
             self.mismatched_entries_per_file, self.term_customizer_files,
-            xliff_source, xliff_target, self.term_customizer_locales
+            xliff_source, xliff_target, self.term_customizer_locales,
+            basenames=self._basename_cache, crowdin_keys=self.crowdin_keys,
+            term_customizer_file_keys=self.term_customizer_file_keys,
+            mismatched_count_per_file=self.mismatched_count_per_file,
+            all_term_keys=self.all_term_keys
         )
         # Store keys to delete (keys only in Term Customizer)
-        all_term_keys = set()
-        for file_path, file_data in self.term_customizer_file_data.items():
-            all_term_keys.update(file_data.keys())
-        crowdin_keys = set(combined_crowdin_data.keys())
-        keys_only_in_term = all_term_keys - crowdin_keys
-        self.keys_to_delete = sorted(list(keys_only_in_term))
+        self._update_keys_to_delete()
         return stats
     
+    def _update_keys_to_delete(self):
+        """Recompute keys only in Term Customizer, only when files changed since last time"""
+        signature = (self._crowdin_version, self._term_version)
+        if signature == self._keys_to_delete_signature:
+            return
+        # Kept as a set, export_deleted_keys sorts them when writing
+        self.keys_to_delete = self.all_term_keys - self.crowdin_keys
+        self._keys_to_delete_signature = signature
+    
+    def _path_parts(self, file_path):
+        """Return (dirname, basename, stem, ext) of file_path, split only once per path"""
+        parts = self._path_parts_cache.get(file_path)
+        if parts is None:
+            directory, basename = os.path.split(file_path)
+            stem, ext = os.path.splitext(basename)
+            parts = (directory, basename, stem, ext)
+            self._path_parts_cache[file_path] = parts
+        return parts
+    
+    def _unique_output_path(self, directory, filename, existing_names):
+        """Return a path in directory for filename that does not clash with an existing file
+        
+        existing_names ({directory: set of entry names}) is filled from one listdir per
+        directory and shared across one save run, so no stat call is needed per candidate.
+        """
+        names = existing_names.get(directory)
+        if names is None:
+            try:
+                names = set(os.listdir(directory))
+            except OSError:
+                names = set()
+            existing_names[directory] = names
+        
+        candidate = filename
+        counter = 1
+        base, ext = os.path.splitext(filename)
+        while candidate in names:
+            candidate = f"{base}_{counter}{ext}"
+            counter += 1
+        names.add(candidate)
+        return os.path.join(directory, candidate)
+    
+    def _insert_content_parts(self, text_widget, content_parts, start=None):
+        """Insert (text, tag) parts into a Text widget with one insert plus one tag_add per tag
+        
+        start is the index of the end of the current content; callers that just
+        cleared the widget pass "1.0" to skip querying it from Tk.
+        """
+        chunks = []
+        tag_ranges = {}  # {tag: [start offset, end offset, ...]}
+        offset = 0
+        for text, tag in content_parts:
+            chunks.append(text)
+            if tag:
+                ranges = tag_ranges.setdefault(tag, [])
+                if ranges and ranges[-1] == offset:
+                    ranges[-1] = offset + len(text)  # Extend the adjacent range
+                else:
+                    ranges.extend((offset, offset + len(text)))
+            offset += len(text)
+        content = ''.join(chunks)
+        if not content:
+            return
+        
+        if _NON_BMP_RE.search(content):
+            # Tk may count characters outside the BMP as two, which would shift the
+            # offsets, so insert the parts with their tags as alternating arguments
+            args = []
+            for text, tag in content_parts:
+                args.append(text)
+                args.append(tag or ())
+            text_widget.insert(start or tk.END, *args)
+            return
+        
+        if start is None:
+            start = text_widget.index('end-1c')
+        text_widget.insert(start, content)
+        for tag, offsets in tag_ranges.items():
+            text_widget.tag_add(tag, *[f"{start}+{o}c" for o in offsets])
+    
     def update_statistics_view(self):
         """Update the statistics display"""
         # Disable updates for better performance
@@ -337,142 +586,178 @@ class DecidimTranslationGUI:
             content_parts.append((f"\n⚠ Warning: {stats['keys_only_in_term_customizer']} keys will be removed as they don't exist in Crowdin.\n", "warning"))
         
         # Insert all content at once
-        for text, tag in content_parts:
-            if tag:
-                self.stats_text.insert(tk.END, text, tag)
-            else:
-                self.stats_text.insert(tk.END, text)
+        self._insert_content_parts(self.stats_text, content_parts, start="1.0")
         
         self.stats_text.config(state=tk.DISABLED)
     
+    def _sync_file_checkbuttons(self, frame, entries, checkbuttons, file_vars, command):
+        """Show one checkbutton per (file_path, label) entry, reusing widgets and vars
+        
+        checkbuttons ({file_path: (Checkbutton, BooleanVar)}) keeps widgets of files that
+        were shown before, so only added files create widgets and removed ones are just
+        unpacked. file_vars is updated in place to the vars of the shown files.
+        
+        Above VIRTUAL_CHECKLIST_THRESHOLD files the list moves into a VirtualChecklist,
+        which shares the same vars but only creates the checkbuttons scrolled into view.
+        """
+        wanted = {}
+        for file_path, label in entries:
+            wanted[file_path] = label
+        
+        checklist = self._virtual_checklists.get(frame)
+        if len(wanted) > VIRTUAL_CHECKLIST_THRESHOLD:
+            if checklist is None:
+                checklist = VirtualChecklist(frame)
+                self._virtual_checklists[frame] = checklist
+            if not checklist.is_shown:
+                # Hide the inline checkbuttons
+                shown = [checkbuttons[file_path][0] for file_path in file_vars]
+                if shown:
+                    frame.tk.call('pack', 'forget', *shown)
+                checklist.show()
+            file_vars.clear()
+            for file_path in wanted:
+                row = checkbuttons.get(file_path)
+                if row is None:
+                    # Var only, the inline checkbutton is created if the list shrinks again
+                    row = (None, tk.BooleanVar(value=False))
+                    checkbuttons[file_path] = row
+                file_vars[file_path] = row[1]
+            checklist.set_entries(list(wanted.items()), file_vars, command)
+            return
+        if checklist is not None and checklist.is_shown:
+            checklist.hide()
+            file_vars.clear()  # Every inline checkbutton needs packing again
+        
+        # Hide checkbuttons of files no longer listed (kept for reuse)
+        to_hide = []
+        for file_path in list(file_vars):
+            if file_path not in wanted:
+                to_hide.append(checkbuttons[file_path][0])
+                del file_vars[file_path]
+        
+        # Show checkbuttons for newly listed files
+        to_show = []
+        for file_path, label in wanted.items():
+            if file_path in file_vars:
+                continue
+            check, var = checkbuttons.get(file_path, (None, None))
+            if check is not None:
+                check.config(text=label)
+            else:
+                if var is None:
+                    var = tk.BooleanVar(value=False)
+                check = ttk.Checkbutton(frame, text=label, variable=var, command=command)
+                checkbuttons[file_path] = (check, var)
+            to_show.append(check)
+            file_vars[file_path] = var
+        
+        # Tk's pack takes any number of widgets, so (un)map them all in one call each
+        if to_hide:
+            frame.tk.call('pack', 'forget', *to_hide)
+        if to_show:
+            frame.tk.call('pack', 'configure', *to_show, '-side', tk.LEFT, '-padx', 5)
+    
     def update_sr_file_selection(self):
         """Update the file selection checkboxes for XLIFF and Term Customizer files"""
         # Only update if frames exist
         if not hasattr(self, 'sr_crowdin_checkboxes_frame') or not hasattr(self, 'sr_term_checkboxes_frame'):
             return
         
-        # Clear existing XLIFF checkboxes
-        for widget in list(self.sr_crowdin_checkboxes_frame.winfo_children()):
-            widget.destroy()
-        self.sr_crowdin_file_vars = {}
-        
-        # Add checkboxes for each XLIFF file
-        for file_path in self.crowdin_files:
-            var = tk.BooleanVar(value=False)
-            self.sr_crowdin_file_vars[file_path] = var
-            filename = os.path.basename(file_path)
-            def make_sr_xliff_check_callback(fp):
-                def callback():
-                    self._sr_languages_cache_valid = False  # Invalidate cache
-                    self.update_sr_languages()
-                return callback
-            check = ttk.Checkbutton(self.sr_crowdin_checkboxes_frame, text=filename, variable=var,
-                                   command=make_sr_xliff_check_callback(file_path))
-            check.pack(side=tk.LEFT, padx=5)
-        
-        # Clear existing Term Customizer checkboxes
-        for widget in list(self.sr_term_checkboxes_frame.winfo_children()):
-            widget.destroy()
-        self.sr_term_file_vars = {}
-        
-        # Add checkboxes for each Term Customizer file
-        for file_path in self.term_customizer_files:
-            var = tk.BooleanVar(value=False)
-            self.sr_term_file_vars[file_path] = var
-            filename = os.path.basename(file_path)
-            def make_sr_check_callback(fp):
-                def callback():
-                    self._sr_languages_cache_valid = False  # Invalidate cache
-                    self.update_sr_languages()
-                return callback
-            check = ttk.Checkbutton(self.sr_term_checkboxes_frame, text=filename, variable=var,
-                                   command=make_sr_check_callback(file_path))
-            check.pack(side=tk.LEFT, padx=5)
-        
-        # Add checkboxes for directly loaded files (for search/replace only)
-        for file_path in self.sr_direct_files.keys():
-            var = tk.BooleanVar(value=False)
-            self.sr_term_file_vars[file_path] = var
-            filename = os.path.basename(file_path)
-            def make_sr_direct_check_callback(fp):
-                def callback():
-                    self._sr_languages_cache_valid = False  # Invalidate cache
-                    self.update_sr_languages()
-                return callback
-            check = ttk.Checkbutton(self.sr_term_checkboxes_frame, text=f"{filename} (direct)", variable=var,
-                                   command=make_sr_direct_check_callback(file_path))
-            check.pack(side=tk.LEFT, padx=5)
+        # Checkboxes for each XLIFF file
+        self._sync_file_checkbuttons(
+            self.sr_crowdin_checkboxes_frame,
+            [(file_path, self._path_parts(file_path)[1]) for file_path in self.crowdin_files],
+            self._sr_crowdin_checkbuttons, self.sr_crowdin_file_vars, self._on_sr_checkbox_toggle)
+        
+        # Checkboxes for each Term Customizer file and directly loaded files (for search/replace only)
+        term_entries = [(file_path, self._path_parts(file_path)[1]) for file_path in self.term_customizer_files]
+        term_entries.extend((file_path, f"{self._path_parts(file_path)[1]} (direct)")
+                            for file_path in self.sr_direct_files.keys())
+        self._sync_file_checkbuttons(
+            self.sr_term_checkboxes_frame, term_entries,
+            self._sr_term_checkbuttons, self.sr_term_file_vars, self._on_sr_checkbox_toggle)
         
         self.update_sr_languages()
     
+    def _on_sr_checkbox_toggle(self):
+        """Shared command of all search/replace file checkbuttons"""
+        self.update_sr_languages()
+    
     def update_sr_languages(self):
         """Update available languages based on selected files - optimized with debouncing"""
         if not hasattr(self, 'sr_language_combo'):
             return
         
-        # Cancel any pending update
-        if self._sr_update_scheduled:
+        # Cancel any pending update, clearing the id first so a failed cancel never leaves it stale
+        pending = self._sr_update_scheduled
+        self._sr_update_scheduled = None
+        if pending is not None:
             try:
-                self.root.after_cancel(self._sr_update_scheduled)
-            except:
+                self.root.after_cancel(pending)
+            except tk.TclError:
                 pass
         
-        # Schedule update with small delay to debounce rapid checkbox clicks
-        self._sr_update_scheduled = self.root.after(50, self._do_update_sr_languages)
+        # Schedule update with a delay to debounce rapid checkbox clicks (e.g. bulk selection);
+        # only the callback of the latest generation does any work
+        self._sr_update_generation += 1
+        self._sr_update_scheduled = self.root.after(150, self._do_update_sr_languages, self._sr_update_generation)
     
-    def _do_update_sr_languages(self):
+    def _do_update_sr_languages(self, generation=None):
         """Actually perform the language update - optimized with caching"""
+        if generation is not None and generation != self._sr_update_generation:
+            return
         self._sr_update_scheduled = None
         
         if not hasattr(self, 'sr_language_combo'):
             return
         
-        # Use cache if available and valid
-        if self._sr_languages_cache_valid and self._sr_languages_cache is not None:
-            sorted_languages = self._sr_languages_cache
-        else:
+        selected_xliff = frozenset(file_path for file_path, var in self.sr_crowdin_file_vars.items() if var.get())
+        selected_files = frozenset(file_path for file_path, var in self.sr_term_file_vars.items() if var.get())
+        
+        # Memoized per selection, so toggling back to an earlier selection is free
+        memo_key = (selected_xliff, selected_files)
+        sorted_languages = self._sr_languages_memo.get(memo_key)
+        if sorted_languages is not None and sorted_languages is self._sr_applied_languages:
+            return  # Same selection as last time and no file changed since, the combo is up to date
+        if sorted_languages is None:
             languages = set()
             
             # Check XLIFF files
-            for file_path, var in self.sr_crowdin_file_vars.items():
-                if var.get() and file_path in self.crowdin_languages:
+            for file_path in selected_xliff:
+                if file_path in self.crowdin_languages:
                     langs = self.crowdin_languages[file_path]
                     if langs['source']:
                         languages.add(langs['source'])
                     if langs['target']:
                         languages.add(langs['target'])
             
-            # Check Term Customizer files (only if selected)
-            selected_files = set()
-            for file_path, var in self.sr_term_file_vars.items():
-                if var.get():
-                    selected_files.add(file_path)
-            
-            # Only check selected files to speed things up
-            files_to_check = selected_files if selected_files else (set(self.term_customizer_file_data.keys()) | set(self.sr_direct_files.keys()))
-            
-            for file_path in files_to_check:
-                file_data = self.term_customizer_file_data.get(file_path) or self.sr_direct_files.get(file_path)
-                if file_data:
-                    # More efficient: collect locales in one pass
-                    for key_data in file_data.values():
-                        if isinstance(key_data, dict):
-                            languages.update(key_data.keys())
+            if selected_files:
+                # Locales are indexed per file at load time, no need to walk the keys
+                for file_path in selected_files:
+                    languages.update(self.term_customizer_file_locales.get(file_path)
+                                     or self.sr_direct_file_locales.get(file_path, ()))
+            else:
+                # Nothing selected: all Term Customizer locales (already kept as a union) and direct files
+                languages.update(self.term_customizer_locales)
+                for file_locales in self.sr_direct_file_locales.values():
+                    languages.update(file_locales)
             
             sorted_languages = sorted(languages)
-            # Cache the result
-            self._sr_languages_cache = sorted_languages
-            self._sr_languages_cache_valid = True
+            self._sr_languages_memo[memo_key] = sorted_languages
         
         # Only update if values changed
         current_values = self.sr_language_combo['values']
-        if tuple(sorted_languages) != tuple(current_values):
+        changed = (len(current_values) != len(sorted_languages)
+                   or any(a != b for a, b in zip(current_values, sorted_languages)))
+        if changed:
             self.sr_language_combo['values'] = sorted_languages
             # Only set default if current value is not in new list
             if sorted_languages:
                 current_val = self.sr_language_var.get()
                 if not current_val or current_val not in sorted_languages:
                     self.sr_language_var.set(sorted_languages[0])
+        self._sr_applied_languages = sorted_languages
         
     def preview_replacements(self):
         """Preview what will be replaced"""
@@ -488,104 +773,84 @@ class DecidimTranslationGUI:
             messagebox.showwarning("Warning", "Please select a language.")
             return
         
-        self.replacement_preview = {}
-        total_replacements = 0
+        # Read the options once and compile the search pattern once for all values
+        replace = self.search_replace_handler.build_replacer(
+            search_term, replace_term, self.sr_case_sensitive_var.get(), self.sr_whole_word_var.get())
         
         # Clear preview
         self.preview_text.delete(1.0, tk.END)
         
+        # Files to scan: (file_path, file_data, field holding the value in each entry)
+        scans = []
+        
         # Process XLIFF files
+        # Interned like the stored XLIFF languages, so equal locales are usually the same object
+        language_lower = sys.intern(language.lower())
         for file_path, var in self.sr_crowdin_file_vars.items():
             if var.get() and file_path in self.crowdin_file_data:
-                file_data = self.crowdin_file_data[file_path]
-                langs = self.crowdin_languages[file_path]
-                xliff_replacements = {}
-                
-                for key, entry in file_data.items():
-                    # Determine which value to check based on language
-                    value = None
-                    if language.lower() == langs['source'].lower():
-                        value = entry.get('source', '') or ''
-                    elif language.lower() == langs['target'].lower():
-                        value = entry.get('target', '') or ''
-                    else:
-                        continue
-                    
-                    if value and self._should_replace(value, search_term):
-                        new_value = self._replace_text(value, search_term, replace_term)
-                        if new_value != value:
-                            xliff_replacements[key] = {
-                                language: {'old': value, 'new': new_value}
-                            }
-                            total_replacements += 1
-                
-                if xliff_replacements:
-                    self.replacement_preview[file_path] = xliff_replacements
+                source_lower, target_lower = self.crowdin_languages_lower[file_path]
+                # Determine which value to check based on language, once per file
+                if language_lower == source_lower:
+                    scans.append((file_path, self.crowdin_file_data[file_path], 'source'))
+                elif language_lower == target_lower:
+                    scans.append((file_path, self.crowdin_file_data[file_path], 'target'))
         
         # Process Term Customizer files
         for file_path, var in self.sr_term_file_vars.items():
             if var.get():
+                # Skip files that have no value in this language without walking their keys
+                file_locales = self.sr_direct_file_locales.get(file_path) or self.term_customizer_file_locales.get(file_path)
+                if file_locales is not None and language not in file_locales:
+                    continue
                 # Check if it's a directly loaded file or a regular Term Customizer file
                 file_data = self.sr_direct_files.get(file_path) or self.term_customizer_file_data.get(file_path, {})
-                file_replacements = {}
-                
-                for key, locales in file_data.items():
-                    if language in locales:
-                        value = locales[language]
-                        if value and self._should_replace(value, search_term):
-                            new_value = self._replace_text(value, search_term, replace_term)
-                            if new_value != value:
-                                if key not in file_replacements:
-                                    file_replacements[key] = {}
-                                file_replacements[key][language] = {'old': value, 'new': new_value}
-                                total_replacements += 1
-                
-                if file_replacements:
-                    self.replacement_preview[file_path] = file_replacements
+                scans.append((file_path, file_data, language))
+        
+        # Flat (file_path, key, locale, old, new) rows plus row indices per file
+        find_replacements = self.search_replace_handler.find_replacements
+        rows = []
+        self.replacement_preview_rows = rows
+        self.replacement_preview_index = {}
+        for file_path, file_data, field in scans:
+            found = find_replacements(file_data, field, replace)
+            if found:
+                start = len(rows)
+                rows.extend((file_path, key, language, value, new_value) for key, value, new_value in found)
+                self.replacement_preview_index[file_path] = list(range(start, len(rows)))
         
         # Display preview
-        if not self.replacement_preview:
+        if not rows:
             self.preview_text.insert(tk.END, "No replacements found.\n")
             return
         
-        self.preview_text.insert(tk.END, f"Found {total_replacements} replacement(s) in {len(self.replacement_preview)} file(s)\n\n", "header")
-        
-        for file_path, replacements in self.replacement_preview.items():
-            filename = os.path.basename(file_path)
-            self.preview_text.insert(tk.END, f"File: {filename}\n", "header")
-            self.preview_text.insert(tk.END, "=" * 80 + "\n\n")
-            
-            for key, locales in sorted(replacements.items()):
-                self.preview_text.insert(tk.END, f"Key: {key}\n")
-                for loc, changes in locales.items():
-                    self.preview_text.insert(tk.END, f"  [{loc}] ", "header")
-                    self.preview_text.insert(tk.END, "Old: ", "header")
-                    self.preview_text.insert(tk.END, f"{changes['old']}\n", "match")
-                    self.preview_text.insert(tk.END, f"      New: ", "header")
-                    self.preview_text.insert(tk.END, f"{changes['new']}\n", "replacement")
-                self.preview_text.insert(tk.END, "\n")
-    
-    def _should_replace(self, text, search_term):
-        """Check if text should be replaced based on options"""
-        case_sensitive = self.sr_case_sensitive_var.get()
-        whole_word = self.sr_whole_word_var.get()
-        return self.search_replace_handler.should_replace(text, search_term, case_sensitive, whole_word)
-    
-    def _replace_text(self, text, search_term, replace_term):
-        """Replace text based on options"""
-        case_sensitive = self.sr_case_sensitive_var.get()
-        whole_word = self.sr_whole_word_var.get()
-        return self.search_replace_handler.replace_text(text, search_term, replace_term, case_sensitive, whole_word)
+        # Build content in memory first, then insert it in one go
+        content_parts = [(f"Found {len(rows)} replacement(s) in {len(self.replacement_preview_index)} file(s)\n\n", "header")]
+        add_part = content_parts.append
+        
+        for file_path, row_indices in self.replacement_preview_index.items():
+            filename = self._path_parts(file_path)[1]
+            add_part((f"File: {filename}\n", "header"))
+            add_part(("=" * 80 + "\n\n", None))
+            
+            for _, key, loc, old_value, new_value in sorted((rows[i] for i in row_indices), key=itemgetter(1)):
+                add_part((f"Key: {key}\n", None))
+                add_part((f"  [{loc}] Old: ", "header"))
+                add_part((f"{old_value}\n", "match"))
+                add_part(("      New: ", "header"))
+                add_part((f"{new_value}\n", "replacement"))
+                add_part(("\n", None))
+        
+        self._insert_content_parts(self.preview_text, content_parts, start="1.0")
     
     def apply_replacements(self):
         """Apply the replacements and save to new files"""
-        if not self.replacement_preview:
+        if not self.replacement_preview_rows:
             messagebox.showwarning("Warning", "Please preview replacements first.")
             return
         
         # Confirm action
-        total_replacements = sum(len(locales) for replacements in self.replacement_preview.values() 
-                                for locales in replacements.values())
+        rows = self.replacement_preview_rows
+        total_replacements = len(rows)
         if not messagebox.askyesno("Confirm", 
                                   f"Save {total_replacements} replacement(s) to new file(s)?\n\n"
                                   "This will create new output files. Original files will not be modified."):
@@ -593,80 +858,45 @@ class DecidimTranslationGUI:
         
         saved_files = []
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        existing_names = {}  # {directory: set of names}, listed once per directory
         
         try:
             # Save XLIFF file replacements (as CSV)
             for file_path in self.crowdin_files:
-                if file_path in self.replacement_preview:
-                    directory = os.path.dirname(file_path) if os.path.dirname(file_path) else os.getcwd()
-                    base_name = os.path.splitext(os.path.basename(file_path))[0]
+                if file_path in self.replacement_preview_index:
+                    directory, _, base_name, _ = self._path_parts(file_path)
+                    directory = directory or os.getcwd()
                     output_filename = f"{base_name}_replaced_{timestamp}.csv"
-                    output_path = os.path.join(directory, output_filename)
-                    
-                    # Ensure unique filename
-                    counter = 1
-                    original_path = output_path
-                    while os.path.exists(output_path):
-                        base, ext = os.path.splitext(original_path)
-                        output_path = f"{base}_{counter}{ext}"
-                        counter += 1
-                    
-                    output_rows = []
-                    for key, locales in self.replacement_preview[file_path].items():
-                        for locale, changes in locales.items():
-                            output_rows.append({
-                                'locale': locale,
-                                'key': key,
-                                'value': changes['new']
-                            })
+                    output_path = self._unique_output_path(directory, output_filename, existing_names)
                     
                     with open(output_path, mode='w', newline='', encoding='utf-8') as file:
-                        fieldnames = ['locale', 'key', 'value']
-                        writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=';')
-                        writer.writeheader()
-                        writer.writerows(output_rows)
+                        writer = csv.writer(file, delimiter=';')
+                        writer.writerow(('locale', 'key', 'value'))
+                        # Stream the rows straight from the preview, no per-row dicts
+                        writer.writerows((rows[i][2], rows[i][1], rows[i][4])
+                                         for i in self.replacement_preview_index[file_path])
                     
                     saved_files.append(output_path)
             
             # Save Term Customizer file replacements
-            for file_path, replacements in self.replacement_preview.items():
+            for file_path, row_indices in self.replacement_preview_index.items():
                 if file_path in self.crowdin_files:
                     continue
                 
-                directory = os.path.dirname(file_path) if os.path.dirname(file_path) else os.getcwd()
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                directory, _, base_name, _ = self._path_parts(file_path)
+                directory = directory or os.getcwd()
                 output_filename = f"{base_name}_replaced_{timestamp}.csv"
-                output_path = os.path.join(directory, output_filename)
-                
-                # Ensure unique filename
-                counter = 1
-                original_path = output_path
-                while os.path.exists(output_path):
-                    base, ext = os.path.splitext(original_path)
-                    output_path = f"{base}_{counter}{ext}"
-                    counter += 1
-                
-                output_rows = []
-                for key, locales in replacements.items():
-                    for locale, changes in locales.items():
-                        output_rows.append({
-                            'locale': locale,
-                            'key': key,
-                            'value': changes['new']
-                        })
+                output_path = self._unique_output_path(directory, output_filename, existing_names)
                 
                 with open(output_path, mode='w', newline='', encoding='utf-8') as file:
-                    fieldnames = ['locale', 'key', 'value']
-                    writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=';')
-                    writer.writeheader()
-                    writer.writerows(output_rows)
+                    writer = csv.writer(file, delimiter=';')
+                    writer.writerow(('locale', 'key', 'value'))
+                    # Stream the rows straight from the preview, no per-row dicts
+                    writer.writerows((rows[i][2], rows[i][1], rows[i][4]) for i in row_indices)
                 
                 saved_files.append(output_path)
-                # Track for easy reloading
+                # Track for easy reloading (bounded deque keeps only the last 10 files)
                 self.last_sr_output_files.append(output_path)
-                # Keep only last 10 files
-                if len(self.last_sr_output_files) > 10:
-                    self.last_sr_output_files.pop(0)
             
             if saved_files:
                 files_list = '\n'.join([os.path.basename(f) for f in saved_files])
@@ -681,7 +911,8 @@ class DecidimTranslationGUI:
             messagebox.showerror("Error", f"Error saving replacement files: {str(e)}")
         
         # Clear preview
-        self.replacement_preview = {}
+        self.replacement_preview_rows = []
+        self.replacement_preview_index = {}
         self.preview_text.delete(1.0, tk.END)
     
     def update_gc_file_selection(self):
@@ -689,57 +920,23 @@ class DecidimTranslationGUI:
         if not hasattr(self, 'gc_crowdin_checkboxes_frame') or not hasattr(self, 'gc_term_checkboxes_frame'):
             return
         
-        # Clear existing XLIFF checkboxes
-        for widget in list(self.gc_crowdin_checkboxes_frame.winfo_children()):
-            widget.destroy()
-        self.gc_crowdin_file_vars = {}
-        
-        # Add checkboxes for each XLIFF file
-        for file_path in self.crowdin_files:
-            var = tk.BooleanVar(value=False)
-            self.gc_crowdin_file_vars[file_path] = var
-            filename = os.path.basename(file_path)
-            def make_gc_xliff_check_callback(fp):
-                def callback():
-                    self._gc_languages_cache_valid = False  # Invalidate cache
-                    self.update_gc_languages()
-                return callback
-            check = ttk.Checkbutton(self.gc_crowdin_checkboxes_frame, text=filename, variable=var,
-                                   command=make_gc_xliff_check_callback(file_path))
-            check.pack(side=tk.LEFT, padx=5)
-        
-        # Clear existing Term Customizer checkboxes
-        for widget in list(self.gc_term_checkboxes_frame.winfo_children()):
-            widget.destroy()
-        self.gc_term_file_vars = {}
-        
-        # Add checkboxes for each Term Customizer file
-        for file_path in self.term_customizer_files:
-            var = tk.BooleanVar(value=False)
-            self.gc_term_file_vars[file_path] = var
-            filename = os.path.basename(file_path)
-            def make_gc_check_callback(fp):
-                def callback():
-                    self._gc_languages_cache_valid = False  # Invalidate cache
-                    self.update_gc_languages()
-                return callback
-            check = ttk.Checkbutton(self.gc_term_checkboxes_frame, text=filename, variable=var,
-                                   command=make_gc_check_callback(file_path))
-            check.pack(side=tk.LEFT, padx=5)
-        
-        # Add checkboxes for directly loaded files (for grammar check only)
-        for file_path in self.gc_direct_files.keys():
-            var = tk.BooleanVar(value=False)
-            self.gc_term_file_vars[file_path] = var
-            filename = os.path.basename(file_path)
-            def make_gc_direct_check_callback(fp):
-                def callback():
-                    self._gc_languages_cache_valid = False  # Invalidate cache
-                    self.update_gc_languages()
-                return callback
-            check = ttk.Checkbutton(self.gc_term_checkboxes_frame, text=f"{filename} (direct)", variable=var,
-                                   command=make_gc_direct_check_callback(file_path))
-            check.pack(side=tk.LEFT, padx=5)
+        # Checkboxes for each XLIFF file
+        self._sync_file_checkbuttons(
+            self.gc_crowdin_checkboxes_frame,
+            [(file_path, self._path_parts(file_path)[1]) for file_path in self.crowdin_files],
+            self._gc_crowdin_checkbuttons, self.gc_crowdin_file_vars, self._on_gc_checkbox_toggle)
+        
+        # Checkboxes for each Term Customizer file and directly loaded files (for grammar check only)
+        term_entries = [(file_path, self._path_parts(file_path)[1]) for file_path in self.term_customizer_files]
+        term_entries.extend((file_path, f"{self._path_parts(file_path)[1]} (direct)")
+                            for file_path in self.gc_direct_files.keys())
+        self._sync_file_checkbuttons(
+            self.gc_term_checkboxes_frame, term_entries,
+            self._gc_term_checkbuttons, self.gc_term_file_vars, self._on_gc_checkbox_toggle)
+    
+    def _on_gc_checkbox_toggle(self):
+        """Shared command of all grammar check file checkbuttons"""
+        self.update_gc_languages()
     
     def load_file_for_grammar_check(self):
         """Load a CSV file directly for grammar checking"""
@@ -752,27 +949,15 @@ class DecidimTranslationGUI:
             return
         
         try:
-            # Load the file
-            file_data = {}
-            file_locales = set()
-            
-            with open(file_path, mode='r', encoding='utf-8') as file:
-                reader = csv.DictReader(file, delimiter=';')
-                for row in reader:
-                    key = row.get('key', '')
-                    value = row.get('value', '')
-                    locale = row.get('locale', '').lower()
-                    if key and locale:
-                        if key not in file_data:
-                            file_data[key] = {}
-                        file_data[key][locale] = value
-                        file_locales.add(locale)
+            # Load the file, same {key: {locale: value}} shape as Term Customizer files
+            file_data, file_locales = self.file_handler.load_csv_file(file_path)
             
             # Store in direct files dictionary
             self.gc_direct_files[file_path] = file_data
+            self.gc_direct_file_locales[file_path] = frozenset(file_locales)
             
             # Invalidate cache when new file is loaded
-            self._gc_languages_cache_valid = False
+            self._gc_languages_memo.clear()
             
             # Update file selection checkboxes (only if tab is initialized)
             if self.tabs_initialized.get('grammar', False):
@@ -798,27 +983,15 @@ class DecidimTranslationGUI:
             return
         
         try:
-            # Load the file
-            file_data = {}
-            file_locales = set()
-            
-            with open(file_path, mode='r', encoding='utf-8') as file:
-                reader = csv.DictReader(file, delimiter=';')
-                for row in reader:
-                    key = row.get('key', '')
-                    value = row.get('value', '')
-                    locale = row.get('locale', '').lower()
-                    if key and locale:
-                        if key not in file_data:
-                            file_data[key] = {}
-                        file_data[key][locale] = value
-                        file_locales.add(locale)
+            # Load the file, same {key: {locale: value}} shape as Term Customizer files
+            file_data, file_locales = self.file_handler.load_csv_file(file_path)
             
             # Store in direct files dictionary
             self.sr_direct_files[file_path] = file_data
+            self.sr_direct_file_locales[file_path] = frozenset(file_locales)
             
             # Invalidate cache when new file is loaded
-            self._sr_languages_cache_valid = False
+            self._sr_languages_memo.clear()
             
             # Update file selection checkboxes (only if tab is initialized)
             if self.tabs_initialized.get('search_replace', False):
@@ -844,6 +1017,9 @@ class DecidimTranslationGUI:
     
     def test_llm_connection(self):
         """Test the LLM API connection with a simple request"""
+        # Imported here: only needed for the connection test and slow to import at startup
+        import urllib.error
+        
         api_key = self.gc_api_key_var.get().strip()
         api_endpoint = self.gc_api_endpoint_var.get().strip()
         model = self.gc_model_var.get().strip() or 'gpt-4o-mini'
@@ -863,7 +1039,7 @@ class DecidimTranslationGUI:
         test_window.transient(self.root)
         test_window.grab_set()
         
-        status_label = ttk.Label(test_window, text="Testing connection to LLM API...", font=Font(weight="bold"))
+        status_label = ttk.Label(test_window, text="Testing connection to LLM API...", font=FONT_BOLD)
         status_label.pack(pady=20)
         
         result_text = scrolledtext.ScrolledText(test_window, height=4, wrap=tk.WORD, width=50)
@@ -871,6 +1047,7 @@ class DecidimTranslationGUI:
         result_text.config(state=tk.DISABLED)
         
         def run_test():
+            """Send the test request (worker thread, no Tk access); return (content parts, status, color)"""
             try:
                 # Prepare a simple test request
                 data = {
@@ -882,37 +1059,29 @@ class DecidimTranslationGUI:
                     "max_tokens": 20
                 }
                 
-                req = urllib.request.Request(
-                    api_endpoint,
-                    data=json.dumps(data).encode('utf-8'),
-                    headers={
-                        'Content-Type': 'application/json',
-                        'Authorization': f'Bearer {api_key}'
-                    }
-                )
+                headers = {
+                    'Content-Type': 'application/json',
+                    'Authorization': f'Bearer {api_key}'
+                }
+                
+                # Same HTTP path as the grammar and tone requests
+                result = json_compat.loads(
+                    get_grammar_tone_handler().post(api_endpoint, json_compat.dumps_bytes(data), headers, 30))
+                
+                if 'choices' not in result or not result['choices']:
+                    return ([(f"ERROR: Invalid API response\nResponse: {json_compat.dumps(result, indent=True)}", "error")],
+                            "Connection Failed", "red")
+                response_text = result['choices'][0]['message']['content'].strip()
+                return ([(f"SUCCESS: Connection working!\n\n", None),
+                         (f"Model: {model}\n", None),
+                         (f"Endpoint: {api_endpoint}\n", None),
+                         (f"Response: {response_text}", None)],
+                        "Connection Successful!", "green")
                 
-                with urllib.request.urlopen(req, timeout=30) as response:
-                    result = json.loads(response.read().decode('utf-8'))
-                    
-                    if 'choices' not in result or not result['choices']:
-                        result_text.config(state=tk.NORMAL)
-                        result_text.insert(tk.END, f"ERROR: Invalid API response\nResponse: {json.dumps(result, indent=2)}", "error")
-                        result_text.config(state=tk.DISABLED)
-                        status_label.config(text="Connection Failed", foreground="red")
-                    else:
-                        response_text = result['choices'][0]['message']['content'].strip()
-                        result_text.config(state=tk.NORMAL)
-                        result_text.insert(tk.END, f"SUCCESS: Connection working!\n\n")
-                        result_text.insert(tk.END, f"Model: {model}\n")
-                        result_text.insert(tk.END, f"Endpoint: {api_endpoint}\n")
-                        result_text.insert(tk.END, f"Response: {response_text}")
-                        result_text.config(state=tk.DISABLED)
-                        status_label.config(text="Connection Successful!", foreground="green")
-                        
             except urllib.error.HTTPError as e:
                 error_body = e.read().decode('utf-8')
                 try:
-                    error_json = json.loads(error_body)
+                    error_json = json_compat.loads(error_body)
                     error_obj = error_json.get('error', {})
                     
                     # Try different error formats
@@ -936,78 +1105,88 @@ class DecidimTranslationGUI:
                     error_type = "HTTP Error"
                     error_code = str(e.code)
                 
-                result_text.config(state=tk.NORMAL)
-                result_text.insert(tk.END, f"ERROR: {error_type} (Code: {error_code})\n\n", "error")
-                result_text.insert(tk.END, f"Message: {error_message}\n\n", "error")
-                result_text.insert(tk.END, f"Full response:\n{error_body}", "error")
-                result_text.config(state=tk.DISABLED)
-                status_label.config(text="Connection Failed", foreground="red")
+                return ([(f"ERROR: {error_type} (Code: {error_code})\n\n", "error"),
+                         (f"Message: {error_message}\n\n", "error"),
+                         (f"Full response:\n{error_body}", "error")],
+                        "Connection Failed", "red")
                 
             except urllib.error.URLError as e:
-                result_text.config(state=tk.NORMAL)
-                result_text.insert(tk.END, f"ERROR: Network error\n\n", "error")
-                result_text.insert(tk.END, f"Details: {str(e)}\n\n", "error")
-                result_text.insert(tk.END, "Please check:\n- Your internet connection\n- The API endpoint URL\n- Firewall/proxy settings", "error")
-                result_text.config(state=tk.DISABLED)
-                status_label.config(text="Connection Failed", foreground="red")
+                return ([(f"ERROR: Network error\n\n", "error"),
+                         (f"Details: {str(e)}\n\n", "error"),
+                         ("Please check:\n- Your internet connection\n- The API endpoint URL\n- Firewall/proxy settings", "error")],
+                        "Connection Failed", "red")
                 
-            except json.JSONDecodeError as e:
-                result_text.config(state=tk.NORMAL)
-                result_text.insert(tk.END, f"ERROR: Invalid JSON response\n\n", "error")
-                result_text.insert(tk.END, f"Details: {str(e)}", "error")
-                result_text.config(state=tk.DISABLED)
-                status_label.config(text="Connection Failed", foreground="red")
+            except json_compat.JSONDecodeError as e:
+                return ([(f"ERROR: Invalid JSON response\n\n", "error"),
+                         (f"Details: {str(e)}", "error")],
+                        "Connection Failed", "red")
                 
             except Exception as e:
-                result_text.config(state=tk.NORMAL)
-                result_text.insert(tk.END, f"ERROR: Unexpected error\n\n", "error")
-                result_text.insert(tk.END, f"Details: {str(e)}", "error")
-                result_text.config(state=tk.DISABLED)
-                status_label.config(text="Connection Failed", foreground="red")
+                return ([(f"ERROR: Unexpected error\n\n", "error"),
+                         (f"Details: {str(e)}", "error")],
+                        "Connection Failed", "red")
+        
+        def show_result():
+            """Poll the request from the Tk thread and show its result once done"""
+            if not future.done():
+                test_window.after(100, show_result)
+                return
+            if not test_window.winfo_exists():
+                return  # Window closed while waiting
+            content_parts, status_text, status_color = future.result()
             
             # Configure error tag
             result_text.tag_config("error", foreground="red")
+            result_text.config(state=tk.NORMAL)
+            self._insert_content_parts(result_text, content_parts, start="1.0")
+            result_text.config(state=tk.DISABLED)
+            status_label.config(text=status_text, foreground=status_color)
             
             # Add close button
             close_btn = ttk.Button(test_window, text="Close", command=test_window.destroy)
             close_btn.pack(pady=5)
         
-        # Run test in a separate thread-like operation (using after to avoid blocking)
-        test_window.after(100, run_test)
+        # Run the request on a worker thread so the window keeps responding during the timeout
+        future = get_background_executor().submit(run_test)
+        test_window.after(100, show_result)
     
     def update_gc_languages(self):
         """Update available languages for grammar checking - optimized with debouncing"""
         if not hasattr(self, 'gc_language_combo'):
             return
         
-        # Cancel any pending update
-        if self._gc_language_update_scheduled:
+        # Cancel any pending update, clearing the id first so a failed cancel never leaves it stale
+        pending = self._gc_language_update_scheduled
+        self._gc_language_update_scheduled = None
+        if pending is not None:
             try:
-                self.root.after_cancel(self._gc_language_update_scheduled)
-            except:
+                self.root.after_cancel(pending)
+            except tk.TclError:
                 pass
         
-        # Schedule update with small delay to debounce rapid checkbox clicks
-        self._gc_language_update_scheduled = self.root.after(100, self._do_update_gc_languages)
+        # Schedule update with a delay to debounce rapid checkbox clicks (e.g. bulk selection);
+        # only the callback of the latest generation does any work
+        self._gc_update_generation += 1
+        self._gc_language_update_scheduled = self.root.after(150, self._do_update_gc_languages, self._gc_update_generation)
     
-    def _do_update_gc_languages(self):
+    def _do_update_gc_languages(self, generation=None):
         """Actually perform the language update - optimized with caching"""
+        if generation is not None and generation != self._gc_update_generation:
+            return
         self._gc_language_update_scheduled = None
         
         if not hasattr(self, 'gc_language_combo'):
             return
         
-        # Use cache if available and valid (when no files are selected, use cached all-languages list)
-        selected_files = set()
+        selected_files = frozenset()
         if hasattr(self, 'gc_term_file_vars'):
-            for file_path, var in self.gc_term_file_vars.items():
-                if var.get():
-                    selected_files.add(file_path)
+            selected_files = frozenset(file_path for file_path, var in self.gc_term_file_vars.items() if var.get())
         
-        # If files are selected, we need to recalculate. Otherwise use cache if available
-        if not selected_files and self._gc_languages_cache_valid and self._gc_languages_cache is not None:
-            sorted_languages = self._gc_languages_cache
-        else:
+        # Memoized per selection (no selection means all files, for initial population)
+        sorted_languages = self._gc_languages_memo.get(selected_files)
+        if sorted_languages is not None and sorted_languages is self._gc_applied_languages:
+            return  # Same selection as last time and no file changed since, the combo is up to date
+        if sorted_languages is None:
             languages = set()
             
             # Check XLIFF files
@@ -1017,41 +1196,32 @@ class DecidimTranslationGUI:
                 if langs['target']:
                     languages.add(langs['target'])
             
-            # Check Term Customizer files (only if selected, or all if none selected for initial population)
-            files_to_check = selected_files if selected_files else set(self.term_customizer_file_data.keys())
-            
-            for file_path in files_to_check:
-                file_data = self.term_customizer_file_data.get(file_path)
-                if file_data:
-                    # More efficient: collect locales in one pass
-                    for key_data in file_data.values():
-                        if isinstance(key_data, dict):
-                            languages.update(key_data.keys())
-            
-            # Check directly loaded files for grammar check (only if selected or for initial population)
-            for file_path in self.gc_direct_files.keys():
-                if not selected_files or file_path in selected_files:
-                    file_data = self.gc_direct_files[file_path]
-                    for key_data in file_data.values():
-                        if isinstance(key_data, dict):
-                            languages.update(key_data.keys())
+            # Term Customizer and directly loaded files (only if selected, or all if none selected
+            # for initial population); locales are indexed per file at load time, no need to walk the keys
+            if selected_files:
+                file_locale_sets = [self.term_customizer_file_locales[file_path] for file_path in selected_files
+                                    if file_path in self.term_customizer_file_locales]
+                file_locale_sets.extend(self.gc_direct_file_locales[file_path] for file_path in selected_files
+                                        if file_path in self.gc_direct_file_locales)
+            else:
+                file_locale_sets = [*self.term_customizer_file_locales.values(), *self.gc_direct_file_locales.values()]
+            languages.update(*file_locale_sets)
             
             sorted_languages = sorted(languages)
-            
-            # Cache the result if no files are selected (for initial population)
-            if not selected_files:
-                self._gc_languages_cache = sorted_languages
-                self._gc_languages_cache_valid = True
+            self._gc_languages_memo[selected_files] = sorted_languages
         
         # Only update if values changed
         current_values = self.gc_language_combo['values']
-        if tuple(sorted_languages) != tuple(current_values):
+        changed = (len(current_values) != len(sorted_languages)
+                   or any(a != b for a, b in zip(current_values, sorted_languages)))
+        if changed:
             self.gc_language_combo['values'] = sorted_languages
             # Only set default if current value is not in new list
             if sorted_languages:
                 current_val = self.gc_language_var.get()
                 if not current_val or current_val not in sorted_languages:
                     self.gc_language_var.set(sorted_languages[0])
+        self._gc_applied_languages = sorted_languages
     
     def extract_placeholders(self, text):
         """Extract all placeholders from text"""
@@ -1063,21 +1233,124 @@ class DecidimTranslationGUI:
         handler = get_grammar_tone_handler()
         return handler.validate_placeholders(original, corrected)
     
-    def call_llm_grammar_check(self, entries, language):
-        """Call LLM API to check grammar for a batch of entries"""
-        handler = get_grammar_tone_handler()
+    def _llm_settings(self):
+        """Read the API settings from the Tk variables: (endpoint, key, model, temperature)"""
         api_key = self.gc_api_key_var.get().strip()
-        api_endpoint = self.gc_api_endpoint_var.get().strip()
-        model = self.gc_model_var.get().strip() or 'gpt-4o-mini'
-        temperature = self.gc_temperature_var.get()
-        
         if not api_key:
             raise Exception("API key not set. Please configure API settings.")
+        api_endpoint = self.gc_api_endpoint_var.get().strip()
+        model = self.gc_model_var.get().strip() or 'gpt-4o-mini'
+        return api_endpoint, api_key, model, self.gc_temperature_var.get()
+    
+    def _run_llm_batches(self, entries, batch_size, call, cache_scope=None):
+        """Send the values of all files to call() in batches, several requests at a time
+        
+        entries is {file_path: ([keys], [values])}. call gets a list of (key, value) pairs
+        and runs on a worker thread, so it must not touch Tk. Each distinct value is sent
+        once across all files, and the batches of every file are submitted up front.
+        
+        Yields (file_path, pending, batches) in file order. pending lists the futures of
+        the file's requests; consume batches only once they are all done. batches
+        yields (batch number, keys, values, results, exception) with one result per key,
+        and must be consumed before the next file. Values answered without a request are
+        yielded as batch 0, including values without any words (see _has_text), which are
+        returned unchanged.
+        With a cache_scope (see _llm_cache_scope), answers from earlier sessions are
+        reused and new answers are stored.
+        """
+        # Repeated strings ("Save", "Cancel", ...) are checked once, the answer applies to every key
+        keys_by_value_per_file = {}
+        first_keys = {}  # {value: key sent along with it}
+        for file_path, (keys, values) in entries.items():
+            keys_by_value = keys_by_value_per_file[file_path] = {}
+            for key, value in zip(keys, values):
+                keys_by_value.setdefault(value, []).append(key)
+            for value, value_keys in keys_by_value.items():
+                first_keys.setdefault(value, value_keys[0])
+        
+        # Numbers, placeholders, URLs and markup only: nothing the LLM could correct
+        answers = {value: value for value in first_keys if not _has_text(value)}  # {value: result}
+        if cache_scope is not None:
+            missing = [value for value in first_keys if value not in answers]
+            if missing:
+                answers.update(get_llm_answer_cache().get_many(cache_scope, missing))
+        unique_values = [value for value in first_keys if value not in answers]
+        batches = _pack_batches(unique_values, batch_size, LLM_MAX_BATCH_TOKENS)
+        batch_index = {value: index for index, batch in enumerate(batches) for value in batch}
+        errors = {}  # {batch index: exception or None}, once the batch is done
+        
+        def wait_for(index):
+            """Record the answers of a finished batch, return its exception"""
+            if index not in errors:
+                batch = batches[index]
+                if not futures[index].done():
+                    # result() would block the Tk thread until the request is answered
+                    raise RuntimeError(f"Batch {index + 1} read before its request finished")
+                try:
+                    result, errors[index] = futures[index].result(), None
+                except Exception as e:
+                    result, errors[index] = None, e
+                if result is not None:
+                    answers.update(zip(batch, result))
+                    if cache_scope is not None:
+                        # Answers the checks reject are asked for again next time instead
+                        get_llm_answer_cache().put_many(
+                            cache_scope, [(value, answer) for value, answer in zip(batch, result)
+                                          if self.validate_placeholders(value, answer)[0]])
+            return errors[index]
+        
+        def file_batches(keys_by_value, values_per_batch):
+            """Yield the batches of one file, in batch order"""
+            known_values = values_per_batch.pop(None, None)
+            if known_values:
+                yield (0, [key for value in known_values for key in keys_by_value[value]],
+                       [value for value in known_values for _ in keys_by_value[value]],
+                       [answers[value] for value in known_values for _ in keys_by_value[value]], None)
+            for index in sorted(values_per_batch):
+                batch = values_per_batch[index]
+                error = wait_for(index)
+                yield (index + 1, [key for value in batch for key in keys_by_value[value]],
+                       [value for value in batch for _ in keys_by_value[value]],
+                       None if error is not None else
+                       [answers[value] for value in batch for _ in keys_by_value[value]], error)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(LLM_MAX_PARALLEL_REQUESTS, len(batches))))
+        try:
+            futures = [executor.submit(call, [(first_keys[value], value) for value in batch])
+                       for batch in batches]
+            for file_path, keys_by_value in keys_by_value_per_file.items():
+                values_per_batch = {}  # {batch index or None when answered: [values]}
+                for value in keys_by_value:
+                    values_per_batch.setdefault(batch_index.get(value), []).append(value)
+                pending = [futures[index] for index in values_per_batch if index is not None]
+                yield file_path, pending, file_batches(keys_by_value, values_per_batch)
+        finally:
+            # Stopped early (e.g. by an error in the caller): drop the batches not sent yet
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _llm_cache_scope(self, settings, system_prompt):
+        """Key for the persistent answers of one model, language and prompt, None when caching is off"""
+        if not self.gc_cache_enabled_var.get():
+            # Fresh answers were asked for, also forget the ones from earlier runs in this session
+            self._llm_response_cache.clear()
+            return None
+        api_endpoint, _, model, temperature = settings
+        return get_llm_answer_cache().make_scope(api_endpoint, model, temperature, system_prompt)
+    
+    def _cached_llm_call(self, system_prompt, user_prompt, expected_count, settings):
+        """Call the LLM API and parse the answer, unless the same prompt was already answered
         
-        # Build prompt using module
-        system_prompt, user_prompt = handler.build_grammar_prompt(language, entries)
+        The prompts only contain the language, mode and values, so re-running a check on
+        unchanged entries costs no request. Safe to call from worker threads.
+        """
+        handler = get_grammar_tone_handler()
+        api_endpoint, api_key, model, temperature = settings
+        prompt_digest = hashlib.blake2b(f"{system_prompt}\0{user_prompt}".encode('utf-8')).digest()
+        cache_key = (api_endpoint, model, temperature, prompt_digest)
+        cached = self._llm_response_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
-        # Make API call using module
         response_text = handler.call_llm_api(
             api_endpoint, api_key, model,
             [
@@ -1087,11 +1360,61 @@ class DecidimTranslationGUI:
             temperature
         )
         
-        # Parse response using module
-        return handler.parse_llm_response(response_text, len(entries))
+        # Parse response using module; only answers with the expected entry count are cached
+        corrected = handler.parse_llm_response(response_text, expected_count)
+        self._llm_response_cache[cache_key] = tuple(corrected)
+        return corrected
+    
+    def call_llm_grammar_check(self, entries, language, settings=None):
+        """Call LLM API to check grammar for a batch of entries
+        
+        settings is the _llm_settings() tuple, required when called from a worker thread.
+        """
+        handler = get_grammar_tone_handler()
+        
+        # Build prompt using module
+        system_prompt, user_prompt = handler.build_grammar_prompt(language, entries)
+        
+        # Make API call using module (answers are reused for identical prompts)
+        return self._cached_llm_call(system_prompt, user_prompt, len(entries), settings or self._llm_settings())
+    
+    def _run_llm_steps(self, steps):
+        """Run a grammar or tone generator on the Tk thread, resuming it once each future it yields is done
+        
+        The futures are polled with after(), so the window keeps handling events while
+        the API requests are in flight. Only one run at a time.
+        """
+        if self._llm_run_active:
+            steps.close()
+            messagebox.showinfo("Info", "A grammar check or tone adjustment is already running.")
+            return
+        self._llm_run_active = True
+        
+        waiting_for = None  # Future the steps last yielded
+        
+        def advance():
+            """Resume the steps until they wait for a future that is not done yet"""
+            nonlocal waiting_for
+            try:
+                # Only resume once the future the steps are waiting for is done
+                while waiting_for is None or waiting_for.done():
+                    waiting_for = next(steps)
+            except StopIteration:
+                self._llm_run_active = False
+                return
+            except BaseException:
+                self._llm_run_active = False
+                raise
+            self.root.after(50, advance)
+        
+        advance()
     
     def initialize_check_and_adjustments(self):
         """Combined method that performs grammar check and tone adjustment (if tone != 'keep')"""
+        self._run_llm_steps(self._initialize_check_and_adjustments_steps())
+    
+    def _initialize_check_and_adjustments_steps(self):
+        """initialize_check_and_adjustments as a generator for _run_llm_steps"""
         language = self.gc_language_var.get()
         if not language:
             messagebox.showwarning("Warning", "Please select a language.")
@@ -1107,120 +1430,110 @@ class DecidimTranslationGUI:
         # Clear previous corrections
         self.grammar_corrections = {}
         self.tone_corrections = {}
+        self.grammar_correction_counts = {}
+        self.tone_correction_counts = {}
         self.grammar_preview_text.delete(1.0, tk.END)
         
         # Step 1: Always do grammar check first
-        self.grammar_preview_text.insert(tk.END, "Step 1: Checking grammar...\n\n", "header")
-        self.grammar_preview_text.update()
+        self._append_grammar_progress("Step 1: Checking grammar...\n\n", "header")
+        self._flush_grammar_progress()
         
         # Call grammar check (this is synchronous, so it will complete before continuing)
         try:
             # Collect entries to check (same logic as check_grammar)
-            entries_to_check = {}  # {file_path: [(key, locale, value), ...]}
+            entries_to_check = {}  # {file_path: ([keys], [values])}, all in the selected language
+            language_lower = sys.intern(language.lower())  # Compared against the interned XLIFF languages
             
             # Check XLIFF files
             for file_path, var in self.gc_crowdin_file_vars.items():
                 if var.get() and file_path in self.crowdin_file_data:
                     file_data = self.crowdin_file_data[file_path]
-                    langs = self.crowdin_languages[file_path]
-                    xliff_entries = []
-                    
-                    for key, entry in file_data.items():
-                        value = None
-                        if language.lower() == langs['source'].lower():
-                            value = entry.get('source', '') or ''
-                        elif language.lower() == langs['target'].lower():
-                            value = entry.get('target', '') or ''
-                        else:
-                            continue
-                        
-                        if value and value.strip():
-                            xliff_entries.append((key, language, value))
-                    
-                    if xliff_entries:
-                        entries_to_check[file_path] = xliff_entries
+                    source_lower, target_lower = self.crowdin_languages_lower[file_path]
+                    # Determine which value to check based on language, once per file
+                    if language_lower == source_lower:
+                        field = 'source'
+                    elif language_lower == target_lower:
+                        field = 'target'
+                    else:
+                        continue
+                    file_entries = [(key, value) for key, entry in file_data.items()
+                                    if (value := entry.get(field)) and value.strip()]
+                    if file_entries:
+                        entries_to_check[file_path] = _split_entries(file_entries)
             
             # Check Term Customizer files
             for file_path, var in self.gc_term_file_vars.items():
                 if var.get():
                     file_data = self.gc_direct_files.get(file_path) or self.term_customizer_file_data.get(file_path, {})
-                    file_entries = []
-                    
-                    for key, locales in file_data.items():
-                        if language in locales:
-                            value = locales[language]
-                            if value and value.strip():
-                                file_entries.append((key, language, value))
-                    
+                    file_entries = [(key, value) for key, locales in file_data.items()
+                                    if (value := locales.get(language)) and value.strip()]  # One lookup per key
                     if file_entries:
-                        entries_to_check[file_path] = file_entries
+                        entries_to_check[file_path] = _split_entries(file_entries)
             
             if not entries_to_check:
                 messagebox.showinfo("Info", "No entries found to check for the selected language.")
                 return
             
             # Process grammar check
-            total_entries = sum(len(entries) for entries in entries_to_check.values())
-            self.grammar_preview_text.insert(tk.END, f"Checking grammar for {total_entries} entries in {len(entries_to_check)} file(s)...\n\n", "header")
-            self.grammar_preview_text.update()
+            total_entries = sum(len(keys) for keys, _ in entries_to_check.values())
+            self._append_grammar_progress(f"Checking grammar for {total_entries} entries in {len(entries_to_check)} file(s)...\n\n", "header")
+            self._flush_grammar_progress()
             
             batch_size = self.gc_batch_size_var.get()
+            settings = self._llm_settings()  # Read on the Tk thread, the batches run on workers
             
+            cache_scope = self._llm_cache_scope(settings, get_grammar_tone_handler().build_grammar_prompt(language, [])[0])
+            # Batches of all files are sent up front, several API requests in flight at a time;
+            # a string repeated in several files is sent once
+            call = partial(self.call_llm_grammar_check, language=language, settings=settings)
+            batch_results = self._run_llm_batches(entries_to_check, batch_size, call, cache_scope)
             # Process each file for grammar
-            for file_path, entries in entries_to_check.items():
-                filename = os.path.basename(file_path)
-                self.grammar_preview_text.insert(tk.END, f"Processing {filename}...\n", "header")
-                self.grammar_preview_text.update()
+            for file_path, pending, file_batches in batch_results:
+                filename = self._path_parts(file_path)[1]
+                self._append_grammar_progress(f"Processing {filename}...\n", "header")
+                self._flush_grammar_progress()
+                # Back to the event loop until the file's batches are answered
+                yield from pending
                 
                 file_corrections = {}
                 
-                # Process in batches
-                for i in range(0, len(entries), batch_size):
-                    batch = entries[i:i+batch_size]
-                    batch_keys = [e[0] for e in batch]
-                    batch_values = [e[2] for e in batch]
-                    
-                    try:
-                        corrected_values = self.call_llm_grammar_check(
-                            list(zip(batch_keys, batch_values)), language
-                        )
-                        
-                        for (key, locale, original), corrected in zip(batch, corrected_values):
-                            is_valid, error_msg = self.validate_placeholders(original, corrected)
-                            
-                            if not is_valid:
-                                self.grammar_preview_text.insert(tk.END, 
-                                    f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
-                                corrected = original
-                            
-                            if corrected != original:
-                                if key not in file_corrections:
-                                    file_corrections[key] = {}
-                                file_corrections[key][locale] = {
-                                    'original': original,
-                                    'corrected': corrected
-                                }
-                    except Exception as e:
-                        error_msg = str(e)
-                        self.grammar_preview_text.insert(tk.END, 
-                            f"\n❌ ERROR processing batch {i//batch_size + 1}:\n", "error")
-                        self.grammar_preview_text.insert(tk.END, 
+                for batch_number, batch_keys, batch_values, corrected_values, error in file_batches:
+                    if error is not None:
+                        error_msg = str(error)
+                        self._append_grammar_progress(
+                            f"\n❌ ERROR processing batch {batch_number}:\n", "error")
+                        self._append_grammar_progress(
                             f"   {error_msg}\n\n", "error")
-                        self.grammar_preview_text.update()
+                        self._flush_grammar_progress()
                         continue
+                    
+                    for key, original, corrected in zip(batch_keys, batch_values, corrected_values):
+                        is_valid, error_msg = self.validate_placeholders(original, corrected)
+                        
+                        if not is_valid:
+                            self._append_grammar_progress(
+                                f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
+                            corrected = original
+                        
+                        if corrected != original:
+                            file_corrections.setdefault(key, {})[language] = {
+                                'original': original,
+                                'corrected': corrected
+                            }
                 
                 if file_corrections:
                     self.grammar_corrections[file_path] = file_corrections
+                    self.grammar_correction_counts[file_path] = len(file_corrections)  # One locale per key in a run
             
             # Step 2: Do tone adjustment if needed
             if tone_mode != "keep":
                 # Only apply tone adjustment to German languages
                 if language.lower() not in ['de', 'de-ch']:
-                    self.grammar_preview_text.insert(tk.END, 
+                    self._append_grammar_progress(
                         f"\n⚠ Tone adjustment skipped: Only available for German (de/de-CH) languages.\n", "warning")
                 else:
-                    self.grammar_preview_text.insert(tk.END, f"\nStep 2: Adjusting tone ({tone_mode})...\n\n", "header")
-                    self.grammar_preview_text.update()
+                    self._append_grammar_progress(f"\nStep 2: Adjusting tone ({tone_mode})...\n\n", "header")
+                    self._flush_grammar_progress()
                     
                     # Collect entries to adjust (use grammar-corrected if available, otherwise original)
                     entries_to_adjust = {}
@@ -1228,78 +1541,69 @@ class DecidimTranslationGUI:
                     if self.grammar_corrections:
                         # Use grammar-corrected values as source
                         for file_path, corrections in self.grammar_corrections.items():
-                            file_entries = []
+                            file_keys, file_values = [], []
                             for key, locales in corrections.items():
                                 if language in locales:
                                     value = locales[language]['corrected']
                                     if value and value.strip():
-                                        file_entries.append((key, language, value))
-                            if file_entries:
-                                entries_to_adjust[file_path] = file_entries
+                                        file_keys.append(key)
+                                        file_values.append(value)
+                            if file_keys:
+                                entries_to_adjust[file_path] = (file_keys, file_values)
                     else:
                         # Use original file data
                         entries_to_adjust = entries_to_check
                     
                     if entries_to_adjust:
+                        cache_scope = self._llm_cache_scope(settings, get_grammar_tone_handler().build_tone_prompt(language, tone_mode, [])[0])
+                        # Batches of all files are sent up front, several API requests in flight at a time;
+                        # a string repeated in several files is sent once
+                        call = partial(self.call_llm_tone_adjustment, language=language, tone_mode=tone_mode, settings=settings)
+                        batch_results = self._run_llm_batches(entries_to_adjust, batch_size, call, cache_scope)
                         # Process tone adjustment
-                        for file_path, entries in entries_to_adjust.items():
-                            filename = os.path.basename(file_path)
-                            self.grammar_preview_text.insert(tk.END, f"Processing {filename}...\n", "header")
-                            self.grammar_preview_text.update()
+                        for file_path, pending, file_batches in batch_results:
+                            filename = self._path_parts(file_path)[1]
+                            self._append_grammar_progress(f"Processing {filename}...\n", "header")
+                            self._flush_grammar_progress()
+                            yield from pending
                             
                             file_corrections = {}
                             
-                            # Process in batches
-                            for i in range(0, len(entries), batch_size):
-                                batch = entries[i:i+batch_size]
-                                batch_keys = [e[0] for e in batch]
-                                batch_values = [e[2] for e in batch]
-                                
-                                try:
-                                    adjusted_values = self.call_llm_tone_adjustment(
-                                        list(zip(batch_keys, batch_values)), language, tone_mode
-                                    )
-                                    
-                                    for (key, locale, original), adjusted in zip(batch, adjusted_values):
-                                        is_valid, error_msg = self.validate_placeholders(original, adjusted)
-                                        
-                                        if not is_valid:
-                                            self.grammar_preview_text.insert(tk.END, 
-                                                f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
-                                            adjusted = original
-                                        
-                                        if adjusted != original:
-                                            if key not in file_corrections:
-                                                file_corrections[key] = {}
-                                            file_corrections[key][locale] = {
-                                                'original': original,
-                                                'corrected': adjusted
-                                            }
-                                except Exception as e:
-                                    error_msg = str(e)
-                                    self.grammar_preview_text.insert(tk.END, 
-                                        f"\n❌ ERROR processing batch {i//batch_size + 1}:\n", "error")
-                                    self.grammar_preview_text.insert(tk.END, 
+                            for batch_number, batch_keys, batch_values, adjusted_values, error in file_batches:
+                                if error is not None:
+                                    error_msg = str(error)
+                                    self._append_grammar_progress(
+                                        f"\n❌ ERROR processing batch {batch_number}:\n", "error")
+                                    self._append_grammar_progress(
                                         f"   {error_msg}\n\n", "error")
-                                    self.grammar_preview_text.update()
+                                    self._flush_grammar_progress()
                                     continue
+                                
+                                for key, original, adjusted in zip(batch_keys, batch_values, adjusted_values):
+                                    is_valid, error_msg = self.validate_placeholders(original, adjusted)
+                                    
+                                    if not is_valid:
+                                        self._append_grammar_progress(
+                                            f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
+                                        adjusted = original
+                                    
+                                    if adjusted != original:
+                                        file_corrections.setdefault(key, {})[language] = {
+                                            'original': original,
+                                            'corrected': adjusted
+                                        }
                             
                             if file_corrections:
                                 self.tone_corrections[file_path] = file_corrections
+                                self.tone_correction_counts[file_path] = len(file_corrections)  # One locale per key in a run
             
             # Display results
             self.display_grammar_results()
             self.update_gc_statistics()
             
             # Show summary message
-            total_grammar = sum(
-                len(locales) for file_corr in self.grammar_corrections.values()
-                for locales in file_corr.values()
-            ) if self.grammar_corrections else 0
-            total_tone = sum(
-                len(locales) for file_corr in self.tone_corrections.values()
-                for locales in file_corr.values()
-            ) if self.tone_corrections else 0
+            total_grammar = sum(self.grammar_correction_counts.values())
+            total_tone = sum(self.tone_correction_counts.values())
             
             if total_grammar > 0 or total_tone > 0:
                 messagebox.showinfo("Check and Adjustments Complete", 
@@ -1316,16 +1620,21 @@ class DecidimTranslationGUI:
         
         except Exception as e:
             error_msg = str(e)
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 f"\n❌ FATAL ERROR:\n\n", "error")
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 f"{error_msg}\n\n", "error")
+            self._flush_grammar_progress()
             messagebox.showerror("Error", 
                                f"Error during check and adjustments:\n\n{error_msg}\n\n"
                                "Check the preview area for more details.")
     
     def check_grammar(self):
         """Check grammar for selected files and language"""
+        self._run_llm_steps(self._check_grammar_steps())
+    
+    def _check_grammar_steps(self):
+        """check_grammar as a generator for _run_llm_steps"""
         language = self.gc_language_var.get()
         if not language:
             messagebox.showwarning("Warning", "Please select a language.")
@@ -1337,45 +1646,35 @@ class DecidimTranslationGUI:
             return
         
         # Collect entries to check
-        entries_to_check = {}  # {file_path: [(key, locale, value), ...]}
+        entries_to_check = {}  # {file_path: ([keys], [values])}, all in the selected language
+        language_lower = sys.intern(language.lower())  # Compared against the interned XLIFF languages
         
         # Check XLIFF files
         for file_path, var in self.gc_crowdin_file_vars.items():
             if var.get() and file_path in self.crowdin_file_data:
                 file_data = self.crowdin_file_data[file_path]
-                langs = self.crowdin_languages[file_path]
-                xliff_entries = []
-                
-                for key, entry in file_data.items():
-                    value = None
-                    if language.lower() == langs['source'].lower():
-                        value = entry.get('source', '') or ''
-                    elif language.lower() == langs['target'].lower():
-                        value = entry.get('target', '') or ''
-                    else:
-                        continue
-                    
-                    if value and value.strip():
-                        xliff_entries.append((key, language, value))
-                
-                if xliff_entries:
-                    entries_to_check[file_path] = xliff_entries
+                source_lower, target_lower = self.crowdin_languages_lower[file_path]
+                # Determine which value to check based on language, once per file
+                if language_lower == source_lower:
+                    field = 'source'
+                elif language_lower == target_lower:
+                    field = 'target'
+                else:
+                    continue
+                file_entries = [(key, value) for key, entry in file_data.items()
+                                if (value := entry.get(field)) and value.strip()]
+                if file_entries:
+                    entries_to_check[file_path] = _split_entries(file_entries)
         
         # Check Term Customizer files
         for file_path, var in self.gc_term_file_vars.items():
             if var.get():
                 # Check if it's a directly loaded file or a regular Term Customizer file
                 file_data = self.gc_direct_files.get(file_path) or self.term_customizer_file_data.get(file_path, {})
-                file_entries = []
-                
-                for key, locales in file_data.items():
-                    if language in locales:
-                        value = locales[language]
-                        if value and value.strip():
-                            file_entries.append((key, language, value))
-                
+                file_entries = [(key, value) for key, locales in file_data.items()
+                                if (value := locales.get(language)) and value.strip()]  # One lookup per key
                 if file_entries:
-                    entries_to_check[file_path] = file_entries
+                    entries_to_check[file_path] = _split_entries(file_entries)
         
         if not entries_to_check:
             messagebox.showinfo("Info", "No entries found to check for the selected language.")
@@ -1383,68 +1682,65 @@ class DecidimTranslationGUI:
         
         # Clear previous corrections
         self.grammar_corrections = {}
+        self.grammar_correction_counts = {}
         self.grammar_preview_text.delete(1.0, tk.END)
         
         # Show progress
-        total_entries = sum(len(entries) for entries in entries_to_check.values())
-        self.grammar_preview_text.insert(tk.END, f"Checking grammar for {total_entries} entries in {len(entries_to_check)} file(s)...\n\n", "header")
-        self.grammar_preview_text.update()
+        total_entries = sum(len(keys) for keys, _ in entries_to_check.values())
+        self._append_grammar_progress(f"Checking grammar for {total_entries} entries in {len(entries_to_check)} file(s)...\n\n", "header")
+        self._flush_grammar_progress()
         
         batch_size = self.gc_batch_size_var.get()
+        settings = self._llm_settings()  # Read on the Tk thread, the batches run on workers
         
         try:
+            cache_scope = self._llm_cache_scope(settings, get_grammar_tone_handler().build_grammar_prompt(language, [])[0])
+            # Batches of all files are sent up front, several API requests in flight at a time;
+            # a string repeated in several files is sent once
+            call = partial(self.call_llm_grammar_check, language=language, settings=settings)
+            batch_results = self._run_llm_batches(entries_to_check, batch_size, call, cache_scope)
             # Process each file
-            for file_path, entries in entries_to_check.items():
-                filename = os.path.basename(file_path)
-                self.grammar_preview_text.insert(tk.END, f"Processing {filename}...\n", "header")
-                self.grammar_preview_text.update()
+            for file_path, pending, file_batches in batch_results:
+                filename = self._path_parts(file_path)[1]
+                self._append_grammar_progress(f"Processing {filename}...\n", "header")
+                self._flush_grammar_progress()
+                # Back to the event loop until the file's batches are answered
+                yield from pending
                 
                 file_corrections = {}
                 
-                # Process in batches
-                for i in range(0, len(entries), batch_size):
-                    batch = entries[i:i+batch_size]
-                    batch_keys = [e[0] for e in batch]
-                    batch_values = [e[2] for e in batch]
-                    
-                    # Call LLM
-                    try:
-                        corrected_values = self.call_llm_grammar_check(
-                            list(zip(batch_keys, batch_values)), language
-                        )
-                        
-                        # Validate and store corrections
-                        for (key, locale, original), corrected in zip(batch, corrected_values):
-                            # Validate placeholders
-                            is_valid, error_msg = self.validate_placeholders(original, corrected)
-                            
-                            if not is_valid:
-                                # If placeholders don't match, keep original
-                                self.grammar_preview_text.insert(tk.END, 
-                                    f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
-                                corrected = original
-                            
-                            if corrected != original:
-                                if key not in file_corrections:
-                                    file_corrections[key] = {}
-                                file_corrections[key][locale] = {
-                                    'original': original,
-                                    'corrected': corrected
-                                }
-                        
-                    except Exception as e:
-                        error_msg = str(e)
+                for batch_number, batch_keys, batch_values, corrected_values, error in file_batches:
+                    if error is not None:
+                        error_msg = str(error)
                         # Show detailed error information
-                        self.grammar_preview_text.insert(tk.END, 
-                            f"\n❌ ERROR processing batch {i//batch_size + 1}:\n", "error")
-                        self.grammar_preview_text.insert(tk.END, 
+                        self._append_grammar_progress(
+                            f"\n❌ ERROR processing batch {batch_number}:\n", "error")
+                        self._append_grammar_progress(
                             f"   {error_msg}\n\n", "error")
-                        self.grammar_preview_text.update()
+                        self._flush_grammar_progress()
                         # Continue with next batch
                         continue
+                    
+                    # Validate and store corrections
+                    for key, original, corrected in zip(batch_keys, batch_values, corrected_values):
+                        # Validate placeholders
+                        is_valid, error_msg = self.validate_placeholders(original, corrected)
+                        
+                        if not is_valid:
+                            # If placeholders don't match, keep original
+                            self._append_grammar_progress(
+                                f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
+                            corrected = original
+                        
+                        if corrected != original:
+                            file_corrections.setdefault(key, {})[language] = {
+                                'original': original,
+                                'corrected': corrected
+                            }
                 
                 if file_corrections:
                     self.grammar_corrections[file_path] = file_corrections
+                    self.grammar_correction_counts[file_path] = len(file_corrections)  # One locale per key in a run
             
             # Display results
             self.display_grammar_results()
@@ -1452,10 +1748,7 @@ class DecidimTranslationGUI:
             
             # Show summary message
             if self.grammar_corrections:
-                total_corrections = sum(
-                    len(locales) for file_corr in self.grammar_corrections.values()
-                    for locales in file_corr.values()
-                )
+                total_corrections = sum(self.grammar_correction_counts.values())
                 messagebox.showinfo("Grammar Check Complete", 
                                   f"Found {total_corrections} correction(s) in {len(self.grammar_corrections)} file(s).\n\n"
                                   "Review the corrections in the preview below.")
@@ -1470,21 +1763,26 @@ class DecidimTranslationGUI:
         except Exception as e:
             error_msg = str(e)
             # Show detailed error in preview
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 f"\n❌ FATAL ERROR during grammar check:\n\n", "error")
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 f"{error_msg}\n\n", "error")
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 "Please check:\n"
                 "- Your API settings (use 'Test Connection' button)\n"
                 "- Your internet connection\n"
                 "- The error details above\n", "error")
+            self._flush_grammar_progress()
             messagebox.showerror("Error", 
                                f"Error during grammar check:\n\n{error_msg}\n\n"
                                "Check the preview area for more details.")
     
     def adjust_tone(self):
         """Adjust tone for selected files and language"""
+        self._run_llm_steps(self._adjust_tone_steps())
+    
+    def _adjust_tone_steps(self):
+        """adjust_tone as a generator for _run_llm_steps"""
         tone_mode = self.gc_tone_var.get()
         if tone_mode == "keep":
             messagebox.showinfo("Info", "Tone adjustment is set to 'keep'. No changes will be made.")
@@ -1508,59 +1806,50 @@ class DecidimTranslationGUI:
             return
         
         # Collect entries to adjust
-        entries_to_adjust = {}  # {file_path: [(key, locale, value), ...]}
+        entries_to_adjust = {}  # {file_path: ([keys], [values])}, all in the selected language
+        language_lower = sys.intern(language.lower())  # Compared against the interned XLIFF languages
         
         # Use grammar corrections if available, otherwise use original files
         if self.grammar_corrections:
             # Use grammar-corrected values as source
             for file_path, corrections in self.grammar_corrections.items():
-                file_entries = []
+                file_keys, file_values = [], []
                 for key, locales in corrections.items():
                     if language in locales:
                         # Use the corrected value from grammar check
                         value = locales[language]['corrected']
                         if value and value.strip():
-                            file_entries.append((key, language, value))
-                if file_entries:
-                    entries_to_adjust[file_path] = file_entries
+                            file_keys.append(key)
+                            file_values.append(value)
+                if file_keys:
+                    entries_to_adjust[file_path] = (file_keys, file_values)
         else:
             # Use original file data
             # Check XLIFF files
             for file_path, var in self.gc_crowdin_file_vars.items():
                 if var.get() and file_path in self.crowdin_file_data:
                     file_data = self.crowdin_file_data[file_path]
-                    langs = self.crowdin_languages[file_path]
-                    xliff_entries = []
-                    
-                    for key, entry in file_data.items():
-                        value = None
-                        if language.lower() == langs['source'].lower():
-                            value = entry.get('source', '') or ''
-                        elif language.lower() == langs['target'].lower():
-                            value = entry.get('target', '') or ''
-                        else:
-                            continue
-                        
-                        if value and value.strip():
-                            xliff_entries.append((key, language, value))
-                    
-                    if xliff_entries:
-                        entries_to_adjust[file_path] = xliff_entries
+                    source_lower, target_lower = self.crowdin_languages_lower[file_path]
+                    # Determine which value to check based on language, once per file
+                    if language_lower == source_lower:
+                        field = 'source'
+                    elif language_lower == target_lower:
+                        field = 'target'
+                    else:
+                        continue
+                    file_entries = [(key, value) for key, entry in file_data.items()
+                                    if (value := entry.get(field)) and value.strip()]
+                    if file_entries:
+                        entries_to_adjust[file_path] = _split_entries(file_entries)
             
             # Check Term Customizer files
             for file_path, var in self.gc_term_file_vars.items():
                 if var.get():
                     file_data = self.gc_direct_files.get(file_path) or self.term_customizer_file_data.get(file_path, {})
-                    file_entries = []
-                    
-                    for key, locales in file_data.items():
-                        if language in locales:
-                            value = locales[language]
-                            if value and value.strip():
-                                file_entries.append((key, language, value))
-                    
+                    file_entries = [(key, value) for key, locales in file_data.items()
+                                    if (value := locales.get(language)) and value.strip()]  # One lookup per key
                     if file_entries:
-                        entries_to_adjust[file_path] = file_entries
+                        entries_to_adjust[file_path] = _split_entries(file_entries)
         
         if not entries_to_adjust:
             messagebox.showinfo("Info", "No entries found to adjust for the selected language.")
@@ -1568,78 +1857,72 @@ class DecidimTranslationGUI:
         
         # Clear previous tone corrections
         self.tone_corrections = {}
+        self.tone_correction_counts = {}
         self.grammar_preview_text.delete(1.0, tk.END)
         
         # Show progress
-        total_entries = sum(len(entries) for entries in entries_to_adjust.values())
-        self.grammar_preview_text.insert(tk.END, f"Adjusting tone ({tone_mode}) for {total_entries} entries in {len(entries_to_adjust)} file(s)...\n\n", "header")
-        self.grammar_preview_text.update()
+        total_entries = sum(len(keys) for keys, _ in entries_to_adjust.values())
+        self._append_grammar_progress(f"Adjusting tone ({tone_mode}) for {total_entries} entries in {len(entries_to_adjust)} file(s)...\n\n", "header")
+        self._flush_grammar_progress()
         
         batch_size = self.gc_batch_size_var.get()
+        settings = self._llm_settings()  # Read on the Tk thread, the batches run on workers
         
         try:
+            cache_scope = self._llm_cache_scope(settings, get_grammar_tone_handler().build_tone_prompt(language, tone_mode, [])[0])
+            # Batches of all files are sent up front, several API requests in flight at a time;
+            # a string repeated in several files is sent once
+            call = partial(self.call_llm_tone_adjustment, language=language, tone_mode=tone_mode, settings=settings)
+            batch_results = self._run_llm_batches(entries_to_adjust, batch_size, call, cache_scope)
             # Process each file
-            for file_path, entries in entries_to_adjust.items():
-                filename = os.path.basename(file_path)
-                self.grammar_preview_text.insert(tk.END, f"Processing {filename}...\n", "header")
-                self.grammar_preview_text.update()
+            for file_path, pending, file_batches in batch_results:
+                filename = self._path_parts(file_path)[1]
+                self._append_grammar_progress(f"Processing {filename}...\n", "header")
+                self._flush_grammar_progress()
+                # Back to the event loop until the file's batches are answered
+                yield from pending
                 
                 file_corrections = {}
                 
-                # Process in batches
-                for i in range(0, len(entries), batch_size):
-                    batch = entries[i:i+batch_size]
-                    batch_keys = [e[0] for e in batch]
-                    batch_values = [e[2] for e in batch]
-                    
-                    # Call LLM
-                    try:
-                        adjusted_values = self.call_llm_tone_adjustment(
-                            list(zip(batch_keys, batch_values)), language, tone_mode
-                        )
-                        
-                        # Validate and store corrections
-                        for (key, locale, original), adjusted in zip(batch, adjusted_values):
-                            # Validate placeholders
-                            is_valid, error_msg = self.validate_placeholders(original, adjusted)
-                            
-                            if not is_valid:
-                                # If placeholders don't match, keep original
-                                self.grammar_preview_text.insert(tk.END, 
-                                    f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
-                                adjusted = original
-                            
-                            if adjusted != original:
-                                if key not in file_corrections:
-                                    file_corrections[key] = {}
-                                file_corrections[key][locale] = {
-                                    'original': original,
-                                    'corrected': adjusted
-                                }
-                        
-                    except Exception as e:
-                        error_msg = str(e)
+                for batch_number, batch_keys, batch_values, adjusted_values, error in file_batches:
+                    if error is not None:
+                        error_msg = str(error)
                         # Show detailed error information
-                        self.grammar_preview_text.insert(tk.END, 
-                            f"\n❌ ERROR processing batch {i//batch_size + 1}:\n", "error")
-                        self.grammar_preview_text.insert(tk.END, 
+                        self._append_grammar_progress(
+                            f"\n❌ ERROR processing batch {batch_number}:\n", "error")
+                        self._append_grammar_progress(
                             f"   {error_msg}\n\n", "error")
-                        self.grammar_preview_text.update()
+                        self._flush_grammar_progress()
                         # Continue with next batch
                         continue
+                    
+                    # Validate and store corrections
+                    for key, original, adjusted in zip(batch_keys, batch_values, adjusted_values):
+                        # Validate placeholders
+                        is_valid, error_msg = self.validate_placeholders(original, adjusted)
+                        
+                        if not is_valid:
+                            # If placeholders don't match, keep original
+                            self._append_grammar_progress(
+                                f"Warning: Placeholder mismatch for key '{key}'. Keeping original.\n", "error")
+                            adjusted = original
+                        
+                        if adjusted != original:
+                            file_corrections.setdefault(key, {})[language] = {
+                                'original': original,
+                                'corrected': adjusted
+                            }
                 
                 if file_corrections:
                     self.tone_corrections[file_path] = file_corrections
+                    self.tone_correction_counts[file_path] = len(file_corrections)  # One locale per key in a run
             
             # Display results
             self.display_grammar_results()
             
             # Show summary message
             if self.tone_corrections:
-                total_corrections = sum(
-                    len(locales) for file_corr in self.tone_corrections.values()
-                    for locales in file_corr.values()
-                )
+                total_corrections = sum(self.tone_correction_counts.values())
                 messagebox.showinfo("Tone Adjustment Complete", 
                                   f"Found {total_corrections} adjustment(s) in {len(self.tone_corrections)} file(s).\n\n"
                                   "Review the adjustments in the preview below.")
@@ -1654,117 +1937,106 @@ class DecidimTranslationGUI:
         except Exception as e:
             error_msg = str(e)
             # Show detailed error in preview
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 f"\n❌ FATAL ERROR during tone adjustment:\n\n", "error")
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 f"{error_msg}\n\n", "error")
-            self.grammar_preview_text.insert(tk.END, 
+            self._append_grammar_progress(
                 "Please check:\n"
                 "- Your API settings (use 'Test Connection' button)\n"
                 "- Your internet connection\n"
                 "- The error details above\n", "error")
+            self._flush_grammar_progress()
             messagebox.showerror("Error", 
                                f"Error during tone adjustment:\n\n{error_msg}\n\n"
                                "Check the preview area for more details.")
     
-    def call_llm_tone_adjustment(self, entries, language, tone_mode):
-        """Call LLM API to adjust tone for a batch of entries"""
-        handler = get_grammar_tone_handler()
-        api_key = self.gc_api_key_var.get().strip()
-        api_endpoint = self.gc_api_endpoint_var.get().strip()
-        model = self.gc_model_var.get().strip() or 'gpt-4o-mini'
-        temperature = self.gc_temperature_var.get()
+    def call_llm_tone_adjustment(self, entries, language, tone_mode, settings=None):
+        """Call LLM API to adjust tone for a batch of entries
         
-        if not api_key:
-            raise Exception("API key not set. Please configure API settings.")
+        settings is the _llm_settings() tuple, required when called from a worker thread.
+        """
+        handler = get_grammar_tone_handler()
         
         # Build prompt using module
         system_prompt, user_prompt = handler.build_tone_prompt(language, tone_mode, entries)
         
-        # Make API call using module
-        response_text = handler.call_llm_api(
-            api_endpoint, api_key, model,
-            [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature
-        )
-        
-        # Parse response using module
-        return handler.parse_llm_response(response_text, len(entries))
+        # Make API call using module (answers are reused for identical prompts)
+        return self._cached_llm_call(system_prompt, user_prompt, len(entries), settings or self._llm_settings())
+    
+    def _corrected_file_paths(self):
+        """Files with grammar corrections first, then files with tone adjustments only"""
+        return [*self.grammar_corrections,
+                *(file_path for file_path in self.tone_corrections if file_path not in self.grammar_corrections)]
+    
+    def _append_grammar_progress(self, text, tag=None):
+        """Queue progress text for the grammar preview, inserted at most every 100 ms
+        
+        The queue is flushed by the calls and at the flush points, before a check waits
+        for its requests and the event loop redraws the preview.
+        """
+        self._grammar_progress_parts.append((text, tag))
+        if time.monotonic() - self._grammar_progress_flushed >= _PROGRESS_FLUSH_INTERVAL:
+            self._flush_grammar_progress()
+    
+    def _flush_grammar_progress(self):
+        """Insert the queued progress text in one go"""
+        if self._grammar_progress_parts:
+            self._insert_content_parts(self.grammar_preview_text, self._grammar_progress_parts)
+            self._grammar_progress_parts.clear()
+        self._grammar_progress_flushed = time.monotonic()
     
     def display_grammar_results(self):
         """Display grammar check and tone adjustment results in preview"""
+        self._grammar_progress_parts.clear()  # Replaced by the results
         self.grammar_preview_text.delete(1.0, tk.END)
         
-        # Combine grammar and tone corrections for display
-        all_corrections = {}
-        for file_path, corrections in self.grammar_corrections.items():
-            if file_path not in all_corrections:
-                all_corrections[file_path] = {}
-            for key, locales in corrections.items():
-                if key not in all_corrections[file_path]:
-                    all_corrections[file_path][key] = {}
-                for locale, changes in locales.items():
-                    all_corrections[file_path][key][locale] = changes
-        
-        # Merge tone corrections (tone corrections override grammar corrections for same key/locale)
-        for file_path, corrections in self.tone_corrections.items():
-            if file_path not in all_corrections:
-                all_corrections[file_path] = {}
-            for key, locales in corrections.items():
-                if key not in all_corrections[file_path]:
-                    all_corrections[file_path][key] = {}
-                for locale, changes in locales.items():
-                    # If this key/locale already has grammar corrections, use the grammar-corrected as original
-                    if locale in all_corrections[file_path].get(key, {}):
-                        all_corrections[file_path][key][locale] = {
-                            'original': all_corrections[file_path][key][locale]['original'],
-                            'corrected': changes['corrected']
-                        }
-                    else:
-                        all_corrections[file_path][key][locale] = changes
-        
-        if not all_corrections:
+        if not self.grammar_corrections and not self.tone_corrections:
             self.grammar_preview_text.insert(tk.END, "No corrections found. All entries are correct.\n")
             return
         
-        total_grammar = sum(
-            len(locales) for file_corr in self.grammar_corrections.values()
-            for locales in file_corr.values()
-        )
-        total_tone = sum(
-            len(locales) for file_corr in self.tone_corrections.values()
-            for locales in file_corr.values()
-        )
-        total_corrections = sum(
-            len(locales) for file_corr in all_corrections.values()
-            for locales in file_corr.values()
-        )
+        # Tone adjustments applied on top of grammar corrections, sorted by key per file
+        merged_per_file = [
+            (file_path, sorted(_merged_corrections(self.grammar_corrections.get(file_path, _EMPTY_MAP),
+                                                   self.tone_corrections.get(file_path, _EMPTY_MAP)),
+                               key=itemgetter(0)))
+            for file_path in self._corrected_file_paths()
+        ]
+        
+        total_grammar = sum(self.grammar_correction_counts.values())
+        total_tone = sum(self.tone_correction_counts.values())
+        total_corrections = sum(len(merged) for _, merged in merged_per_file)
         
-        self.grammar_preview_text.insert(tk.END, 
-            f"Found {total_corrections} correction(s) in {len(all_corrections)} file(s)\n", "header")
+        # Build content in memory first
+        content_parts = []
+        content_parts.append((f"Found {total_corrections} correction(s) in {len(merged_per_file)} file(s)\n", "header"))
         if total_grammar > 0:
-            self.grammar_preview_text.insert(tk.END, f"  - Grammar: {total_grammar}\n", "header")
+            content_parts.append((f"  - Grammar: {total_grammar}\n", "header"))
         if total_tone > 0:
-            self.grammar_preview_text.insert(tk.END, f"  - Tone: {total_tone}\n", "header")
-        self.grammar_preview_text.insert(tk.END, "\n")
-        
-        for file_path, corrections in all_corrections.items():
-            filename = os.path.basename(file_path)
-            self.grammar_preview_text.insert(tk.END, f"File: {filename}\n", "header")
-            self.grammar_preview_text.insert(tk.END, "=" * 80 + "\n\n")
-            
-            for key, locales in sorted(corrections.items()):
-                self.grammar_preview_text.insert(tk.END, f"Key: {key}\n")
-                for locale, changes in locales.items():
-                    self.grammar_preview_text.insert(tk.END, f"  [{locale}] ", "header")
-                    self.grammar_preview_text.insert(tk.END, "Original: ", "header")
-                    self.grammar_preview_text.insert(tk.END, f"{changes['original']}\n", "original")
-                    self.grammar_preview_text.insert(tk.END, f"           Corrected: ", "header")
-                    self.grammar_preview_text.insert(tk.END, f"{changes['corrected']}\n", "corrected")
-                self.grammar_preview_text.insert(tk.END, "\n")
+            content_parts.append((f"  - Tone: {total_tone}\n", "header"))
+        content_parts.append(("\n", None))
+        
+        for file_path, merged in merged_per_file:
+            filename = self._path_parts(file_path)[1]
+            content_parts.append((f"File: {filename}\n", "header"))
+            content_parts.append(("=" * 80 + "\n\n", None))
+            
+            previous_key = None
+            for key, locale, original, corrected in merged:
+                if key != previous_key:
+                    if previous_key is not None:
+                        content_parts.append(("\n", None))
+                    content_parts.append((f"Key: {key}\n", None))
+                    previous_key = key
+                content_parts.append((f"  [{locale}] ", "header"))
+                content_parts.append(("Original: ", "header"))
+                content_parts.append((f"{original}\n", "original"))
+                content_parts.append((f"           Corrected: ", "header"))
+                content_parts.append((f"{corrected}\n", "corrected"))
+            if previous_key is not None:
+                content_parts.append(("\n", None))
+        
+        self._insert_content_parts(self.grammar_preview_text, content_parts, start="1.0")
     
     def update_gc_statistics(self):
         """Update the statistics view for grammar check and tone adjustments"""
@@ -1778,18 +2050,14 @@ class DecidimTranslationGUI:
         content_parts.append(("GRAMMAR CHECK & TONE ADJUSTMENT STATISTICS\n", "header"))
         content_parts.append(("=" * 80 + "\n\n", None))
         
-        # Count corrections
-        total_grammar = sum(
-            len(locales) for file_corr in self.grammar_corrections.values()
-            for locales in file_corr.values()
-        ) if self.grammar_corrections else 0
-        
-        total_tone = sum(
-            len(locales) for file_corr in self.tone_corrections.values()
-            for locales in file_corr.values()
-        ) if self.tone_corrections else 0
+        # Counted per file as the corrections are stored
+        grammar_counts = self.grammar_correction_counts
+        tone_counts = self.tone_correction_counts
+        total_grammar = sum(grammar_counts.values())
+        total_tone = sum(tone_counts.values())
         
-        total_files = len(set(list(self.grammar_corrections.keys()) + list(self.tone_corrections.keys())))
+        all_files = grammar_counts.keys() | tone_counts.keys()
+        total_files = len(all_files)
         
         content_parts.append(("Overall Results:\n", "subheader"))
         content_parts.append((f"  Files processed: {total_files}\n", None))
@@ -1805,18 +2073,12 @@ class DecidimTranslationGUI:
             content_parts.append(("Per-File Statistics:\n", "header"))
             content_parts.append(("=" * 80 + "\n\n", None))
             
-            all_files = set(list(self.grammar_corrections.keys()) + list(self.tone_corrections.keys()))
             for file_path in sorted(all_files):
-                filename = os.path.basename(file_path)
+                filename = self._path_parts(file_path)[1]
                 content_parts.append((f"File: {filename}\n", "subheader"))
                 
-                grammar_count = sum(
-                    len(locales) for locales in self.grammar_corrections.get(file_path, {}).values()
-                ) if file_path in self.grammar_corrections else 0
-                
-                tone_count = sum(
-                    len(locales) for locales in self.tone_corrections.get(file_path, {}).values()
-                ) if file_path in self.tone_corrections else 0
+                grammar_count = grammar_counts.get(file_path, 0)
+                tone_count = tone_counts.get(file_path, 0)
                 
                 content_parts.append((f"  Grammar corrections: ", "subheader"))
                 content_parts.append((f"{grammar_count}\n", "number"))
@@ -1829,48 +2091,24 @@ class DecidimTranslationGUI:
             content_parts.append(("No corrections found. All entries are correct.\n", None))
         
         # Insert all content at once
-        for text, tag in content_parts:
-            if tag:
-                self.gc_stats_text.insert(tk.END, text, tag)
-            else:
-                self.gc_stats_text.insert(tk.END, text)
+        self._insert_content_parts(self.gc_stats_text, content_parts, start="1.0")
         
         self.gc_stats_text.config(state=tk.DISABLED)
     
     def save_grammar_corrections(self):
         """Save grammar-corrected and tone-adjusted entries to new files"""
-        # Combine grammar and tone corrections
-        all_corrections = {}
-        for file_path, corrections in self.grammar_corrections.items():
-            if file_path not in all_corrections:
-                all_corrections[file_path] = {}
-            for key, locales in corrections.items():
-                if key not in all_corrections[file_path]:
-                    all_corrections[file_path][key] = {}
-                for locale, changes in locales.items():
-                    all_corrections[file_path][key][locale] = changes['corrected']
-        
-        # Merge tone corrections (tone corrections override grammar corrections for same key/locale)
-        for file_path, corrections in self.tone_corrections.items():
-            if file_path not in all_corrections:
-                all_corrections[file_path] = {}
-            for key, locales in corrections.items():
-                if key not in all_corrections[file_path]:
-                    all_corrections[file_path][key] = {}
-                for locale, changes in locales.items():
-                    all_corrections[file_path][key][locale] = changes['corrected']
-        
-        if not all_corrections:
+        if not self.grammar_corrections and not self.tone_corrections:
             messagebox.showwarning("Warning", "No corrections to save. Please run grammar check or tone adjustment first.")
             return
         
         saved_files = []
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        existing_names = {}  # {directory: set of names}, listed once per directory
         
         try:
-            for file_path, corrections in all_corrections.items():
-                directory = os.path.dirname(file_path) if os.path.dirname(file_path) else os.getcwd()
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
+            for file_path in self._corrected_file_paths():
+                directory, _, base_name, _ = self._path_parts(file_path)
+                directory = directory or os.getcwd()
                 
                 # Determine suffix based on what was done
                 has_grammar = file_path in self.grammar_corrections
@@ -1885,32 +2123,15 @@ class DecidimTranslationGUI:
                     suffix = "corrected"
                 
                 output_filename = f"{base_name}_{suffix}_{timestamp}.csv"
-                output_path = os.path.join(directory, output_filename)
+                output_path = self._unique_output_path(directory, output_filename, existing_names)
                 
-                # Ensure unique filename
-                counter = 1
-                original_path = output_path
-                while os.path.exists(output_path):
-                    base, ext = os.path.splitext(original_path)
-                    output_path = f"{base}_{counter}{ext}"
-                    counter += 1
-                
-                # Prepare output rows
-                output_rows = []
-                for key, locales in corrections.items():
-                    for locale, value in locales.items():
-                        output_rows.append({
-                            'locale': locale,
-                            'key': key,
-                            'value': value
-                        })
-                
-                # Write to file
+                # Write rows as they are merged, without building them in memory
                 with open(output_path, mode='w', newline='', encoding='utf-8') as file:
-                    fieldnames = ['locale', 'key', 'value']
-                    writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=';')
-                    writer.writeheader()
-                    writer.writerows(output_rows)
+                    writer = csv.writer(file, delimiter=';')
+                    writer.writerow(('locale', 'key', 'value'))
+                    merged = _merged_corrections(self.grammar_corrections.get(file_path, _EMPTY_MAP),
+                                                 self.tone_corrections.get(file_path, _EMPTY_MAP))
+                    writer.writerows((locale, key, corrected) for key, locale, _, corrected in merged)
                 
                 saved_files.append(output_path)
             
@@ -1943,6 +2164,7 @@ class DecidimTranslationGUI:
             loaded_count = 0
             already_loaded = []
             for file_path in file_paths:
+                file_path = sys.intern(file_path)
                 if file_path not in self.crowdin_files:
                     if self.load_crowdin_file(file_path):
                         self.crowdin_files.append(file_path)
@@ -1961,8 +2183,8 @@ class DecidimTranslationGUI:
             if loaded_count > 0:
                 self.update_locale_info()
                 # Invalidate caches when files change
-                self._sr_languages_cache_valid = False
-                self._gc_languages_cache_valid = False
+                self._sr_languages_memo.clear()
+                self._gc_languages_memo.clear()
                 
                 # Update search & replace languages (only if tab is initialized)
                 if hasattr(self, 'sr_language_combo') and self.tabs_initialized.get('search_replace', False):
@@ -2004,12 +2226,18 @@ class DecidimTranslationGUI:
             del self.crowdin_file_data[file_path]
         if file_path in self.crowdin_languages:
             del self.crowdin_languages[file_path]
+        self.crowdin_languages_lower.pop(file_path, None)
+        # Keys can be shared between files, so rebuild from the remaining ones
+        self.crowdin_keys = set()
+        for file_data in self.crowdin_file_data.values():
+            self.crowdin_keys.update(file_data)
+        self._crowdin_version += 1
         
         # Update UI
         self.update_locale_info()
         # Invalidate caches when files change
-        self._sr_languages_cache_valid = False
-        self._gc_languages_cache_valid = False
+        self._sr_languages_memo.clear()
+        self._gc_languages_memo.clear()
         
         # Update search & replace languages (only if tab is initialized)
         if hasattr(self, 'sr_language_combo') and self.tabs_initialized.get('search_replace', False):
@@ -2055,14 +2283,16 @@ class DecidimTranslationGUI:
         )
         if file_paths:
             for file_path in file_paths:
+                file_path = sys.intern(file_path)
                 if file_path not in self.term_customizer_files:
                     self.term_customizer_files.append(file_path)
-                    self.term_customizer_listbox.insert(tk.END, os.path.basename(file_path))
+                    self._basename_cache[file_path] = os.path.basename(file_path)
+                    self.term_customizer_listbox.insert(tk.END, self._basename_cache[file_path])
                     self.load_term_customizer_file(file_path)
             self.update_locale_info()
             # Invalidate caches when files change
-            self._sr_languages_cache_valid = False
-            self._gc_languages_cache_valid = False
+            self._sr_languages_memo.clear()
+            self._gc_languages_memo.clear()
             
             # Update search & replace file selection (only if tab is initialized)
             if hasattr(self, 'sr_term_file_vars') and self.tabs_initialized.get('search_replace', False):
@@ -2074,15 +2304,20 @@ class DecidimTranslationGUI:
                     self.update_gc_languages()
     
     def clear_term_customizer_files(self):
-        self.term_customizer_files = []
-        self.term_customizer_data = {}
-        self.term_customizer_file_data = {}
-        self.term_customizer_locales = set()
+        self.term_customizer_files.clear()
+        self._basename_cache.clear()
+        self.term_customizer_data.clear()
+        self.term_customizer_file_data.clear()
+        self.term_customizer_file_keys.clear()
+        self.term_customizer_file_locales.clear()
+        self.all_term_keys.clear()
+        self._term_version += 1
+        self.term_customizer_locales.clear()
         self.term_customizer_listbox.delete(0, tk.END)
         self.update_locale_info()
         # Invalidate caches when files change
-        self._sr_languages_cache_valid = False
-        self._gc_languages_cache_valid = False
+        self._sr_languages_memo.clear()
+        self._gc_languages_memo.clear()
         
         # Update search & replace file selection (only if tab is initialized)
         if hasattr(self, 'sr_term_file_vars') and self.tabs_initialized.get('search_replace', False):
@@ -2094,6 +2329,52 @@ class DecidimTranslationGUI:
                 self.update_gc_languages()
         messagebox.showinfo("Cleared", "All Term Customizer files have been cleared")
             
+    def _poll_crowdin_loads(self):
+        """Install XLIFF files parsed in the background (runs on the Tk thread)"""
+        loaded_any = False
+        for file_path, future in list(self._pending_crowdin_loads.items()):
+            if not future.done():
+                continue
+            del self._pending_crowdin_loads[file_path]
+            # Skip files removed (or already loaded on demand) while parsing
+            if file_path not in self.crowdin_files or file_path in self.crowdin_file_data:
+                continue
+            try:
+                data, count, source_lang, target_lang = future.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"Error loading XLIFF file {os.path.basename(file_path)}: {str(e)}")
+                continue
+            self._install_crowdin_data(file_path, data, source_lang, target_lang)
+            loaded_any = True
+        
+        if loaded_any:
+            # Invalidate caches when files change
+            self._sr_languages_memo.clear()
+            self._gc_languages_memo.clear()
+            if hasattr(self, 'sr_language_combo') and self.tabs_initialized.get('search_replace', False):
+                self.update_sr_languages()
+            if hasattr(self, 'gc_language_combo') and self.tabs_initialized.get('grammar', False):
+                self.update_gc_languages()
+        
+        if self._pending_crowdin_loads:
+            self.locale_info_label.config(
+                text=f"Loading {len(self._pending_crowdin_loads)} XLIFF file(s)...", foreground="gray")
+            self.root.after(50, self._poll_crowdin_loads)
+        else:
+            self.update_locale_info()
+    
+    def _install_crowdin_data(self, file_path, data, source_lang, target_lang):
+        """Store parsed XLIFF data for a file"""
+        self.crowdin_file_data[file_path] = data
+        self.crowdin_keys.update(data)
+        self.crowdin_languages[file_path] = {
+            'source': source_lang,
+            'target': target_lang
+        }
+        self.crowdin_languages_lower[file_path] = (sys.intern((source_lang or '').lower()),
+                                                   sys.intern((target_lang or '').lower()))
+        self._crowdin_version += 1
+    
     def load_crowdin_file(self, file_path):
         """Load a single XLIFF file and store its data"""
         if not file_path:
@@ -2107,11 +2388,7 @@ class DecidimTranslationGUI:
                 data, count, source_lang, target_lang = self.file_handler.load_xliff_file(file_path)
                 
                 # Store per-file data
-                self.crowdin_file_data[file_path] = data
-                self.crowdin_languages[file_path] = {
-                    'source': source_lang,
-                    'target': target_lang
-                }
+                self._install_crowdin_data(file_path, data, source_lang, target_lang)
                 
                 return True
             else:
@@ -2128,14 +2405,18 @@ class DecidimTranslationGUI:
             
             # Also add to combined data
             for key, locales in file_data.items():
-                if key not in self.term_customizer_data:
-                    self.term_customizer_data[key] = {}
+                merged = self.term_customizer_data.setdefault(key, {})
                 for locale, value in locales.items():
-                    self.term_customizer_data[key][locale] = value
+                    merged[locale] = value
                     self.term_customizer_locales.add(locale)
             
             # Store per-file data
             self.term_customizer_file_data[file_path] = file_data
+            self.term_customizer_file_locales[file_path] = frozenset(file_locales)
+            file_keys = frozenset(file_data)
+            self.term_customizer_file_keys[file_path] = file_keys
+            self.all_term_keys |= file_keys
+            self._term_version += 1
             
         except Exception as e:
             messagebox.showerror("Error", f"Error loading Term Customizer file {os.path.basename(file_path)}: {str(e)}")
@@ -2201,11 +2482,11 @@ class DecidimTranslationGUI:
             # Collect all XLIFF languages for validation
             all_xliff_sources = set()
             all_xliff_targets = set()
-            for file_path, langs in self.crowdin_languages.items():
-                if langs.get('source'):
-                    all_xliff_sources.add(langs['source'].lower())
-                if langs.get('target'):
-                    all_xliff_targets.add(langs['target'].lower())
+            for source_lower, target_lower in self.crowdin_languages_lower.values():
+                if source_lower:
+                    all_xliff_sources.add(source_lower)
+                if target_lower:
+                    all_xliff_targets.add(target_lower)
             
             # Validate locale matching
             unmatched_locales = []
@@ -2230,41 +2511,45 @@ class DecidimTranslationGUI:
             for file_path, file_data in self.crowdin_file_data.items():
                 if file_path not in self.crowdin_languages:
                     continue  # Skip if languages not loaded for this file
-                langs = self.crowdin_languages[file_path]
                 for key, entry in file_data.items():
-                    if key not in combined_crowdin_data:
+                    source = entry.get('source') or ''
+                    target = entry.get('target') or ''
+                    slot = combined_crowdin_data.get(key)
+                    if slot is None:
                         combined_crowdin_data[key] = {
-                            'source': entry.get('source', '') or '',
-                            'target': entry.get('target', '') or '',
-                            'files': []
+                            'source': source,
+                            'target': target,
+                            'files': [file_path]
                         }
+                        continue
                     # Merge values (prefer non-empty values)
-                    if entry.get('source') and not combined_crowdin_data[key]['source']:
-                        combined_crowdin_data[key]['source'] = entry.get('source', '') or ''
-                    if entry.get('target') and not combined_crowdin_data[key]['target']:
-                        combined_crowdin_data[key]['target'] = entry.get('target', '') or ''
-                    if file_path not in combined_crowdin_data[key]['files']:
-                        combined_crowdin_data[key]['files'].append(file_path)
+                    if source and not slot['source']:
+                        slot['source'] = source
+                    if target and not slot['target']:
+                        slot['target'] = target
+                    # Each file is visited once, so file_path can't be listed yet
+                    slot['files'].append(file_path)
                 
             # Find mismatches using configured conditional logic
             self.mismatched_entries = {}
             self.mismatched_entries_per_file = {}
+            self.mismatched_count_per_file = {}
             
             # Calculate keys to delete (keys only in Term Customizer, not in any Crowdin file)
-            all_term_keys = set()
-            for file_path, file_data in self.term_customizer_file_data.items():
-                all_term_keys.update(file_data.keys())
-            crowdin_keys = set(combined_crowdin_data.keys())
-            keys_only_in_term = all_term_keys - crowdin_keys
-            self.keys_to_delete = sorted(list(keys_only_in_term))
+            self._update_keys_to_delete()
             
             # Use comparison logic helper methods
-            values_differ = lambda v1, v2: self.comparison_logic.values_differ(v1, v2, include_empty, case_sensitive)
-            should_check_value = lambda tv, rv: self.comparison_logic.should_check_value(tv, rv)
+            # Normalized values are cached for this run only (depends on case_sensitive)
+            norm_cache = {}
+            differ = self.comparison_logic.values_differ
+            values_differ = lambda v1, v2: differ(v1, v2, include_empty, case_sensitive, norm_cache)
+            # require_term_value is fixed for the whole run, so pick the check once
+            should_check_value = self.comparison_logic.make_should_check(require_term_value)
+            crowdin_languages_lower = self.crowdin_languages_lower
             
             # Compare for each Term Customizer file separately
             for term_file_path in self.term_customizer_files:
-                term_file_data = self.term_customizer_file_data.get(term_file_path, {})
+                term_file_data = self.term_customizer_file_data.get(term_file_path, _EMPTY_MAP)
                 file_mismatches = {}
                 
                 # Compare for each matching locale
@@ -2286,18 +2571,19 @@ class DecidimTranslationGUI:
                         
                         # Try to find a matching XLIFF file for this locale
                         for xliff_file_path, xliff_data in self.crowdin_file_data.items():
-                            if xliff_file_path not in self.crowdin_languages:
+                            langs_lower = crowdin_languages_lower.get(xliff_file_path)
+                            if langs_lower is None:
                                 continue
-                            langs = self.crowdin_languages[xliff_file_path]
-                            if key in xliff_data:
-                                if locale_lower == langs.get('source', '').lower():
+                            xliff_entry = xliff_data.get(key)
+                            if xliff_entry is not None:
+                                if locale_lower == langs_lower[0]:
                                     # Source language: use XLIFF source
-                                    xliff_value = xliff_data[key].get('source', '') or ''
+                                    xliff_value = xliff_entry.get('source', '') or ''
                                     matching_xliff_file = xliff_file_path
                                     break
-                                elif locale_lower == langs.get('target', '').lower():
+                                elif locale_lower == langs_lower[1]:
                                     # Target language: use XLIFF target
-                                    xliff_value = xliff_data[key].get('target', '') or ''
+                                    xliff_value = xliff_entry.get('target', '') or ''
                                     matching_xliff_file = xliff_file_path
                                     break
                         
@@ -2311,7 +2597,7 @@ class DecidimTranslationGUI:
                                 continue
                         
                         # Check for mismatch
-                        if should_check_value(term_value, require_term_value):
+                        if should_check_value(term_value):
                             if values_differ(term_value, xliff_value):
                                 entry_mismatches[locale] = {
                                     'term_value': term_value,
@@ -2321,28 +2607,25 @@ class DecidimTranslationGUI:
                     
                     # Add to mismatched entries if any locale has a mismatch
                     if entry_mismatches:
-                        if key not in file_mismatches:
-                            file_mismatches[key] = {
-                                'crowdin_source': crowdin_entry['source'],
-                                'crowdin_target': crowdin_entry['target'],
-                                'term_values': {}
-                            }
-                        # Store mismatches for each locale
-                        for locale, mismatch_data in entry_mismatches.items():
-                            file_mismatches[key]['term_values'][locale] = mismatch_data['term_value']
-                        
+                        file_term_values = file_mismatches.setdefault(key, {
+                            'crowdin_source': crowdin_entry['source'],
+                            'crowdin_target': crowdin_entry['target'],
+                            'term_values': {}
+                        })['term_values']
                         # Also add to combined mismatches
-                        if key not in self.mismatched_entries:
-                            self.mismatched_entries[key] = {
-                                'crowdin_source': crowdin_entry['source'],
-                                'crowdin_target': crowdin_entry['target'],
-                                'term_values': {}
-                            }
+                        all_term_values = self.mismatched_entries.setdefault(key, {
+                            'crowdin_source': crowdin_entry['source'],
+                            'crowdin_target': crowdin_entry['target'],
+                            'term_values': {}
+                        })['term_values']
+                        # Store mismatches for each locale
                         for locale, mismatch_data in entry_mismatches.items():
-                            self.mismatched_entries[key]['term_values'][locale] = mismatch_data['term_value']
+                            file_term_values[locale] = mismatch_data['term_value']
+                            all_term_values[locale] = mismatch_data['term_value']
                 
                 # Store per-file mismatches
                 self.mismatched_entries_per_file[term_file_path] = file_mismatches
+                self.mismatched_count_per_file[term_file_path] = len(file_mismatches)
                             
             # Update diff view
             self.update_diff_view()
@@ -2353,7 +2636,7 @@ class DecidimTranslationGUI:
             # Update statistics view
             self.update_statistics_view()
             
-            total_mismatches = sum(len(m) for m in self.mismatched_entries_per_file.values())
+            total_mismatches = sum(self.mismatched_count_per_file.values())
             stats = self.calculate_statistics()
             messagebox.showinfo("Comparison Complete", 
                               f"Found {total_mismatches} mismatched entries across {len(self.term_customizer_files)} file(s)\n\n"
@@ -2368,22 +2651,17 @@ class DecidimTranslationGUI:
             print(error_msg)  # Also print to console for debugging
         
     def update_diff_view(self):
-        self.diff_text.config(state=tk.NORMAL)
-        self.diff_text.delete(1.0, tk.END)
+        # Clear existing rows
+        children = self.diff_tree.get_children()
+        if children:
+            self.diff_tree.delete(*children)
         
         if not self.mismatched_entries:
-            self.diff_text.insert(tk.END, "No mismatches found. Files are in sync.\n")
-            self.diff_text.config(state=tk.DISABLED)
+            self.diff_tree.insert("", tk.END, values=("", "", "", "No mismatches found. Files are in sync."))
             return
         
-        # Build content in memory first for better performance
-        content_parts = []
+        insert = self.diff_tree.insert
         for key, entry in sorted(self.mismatched_entries.items()):
-            # Header
-            content_parts.append(("\n" + "="*80 + "\n", "header"))
-            content_parts.append((f"Key: {key}\n", "header"))
-            content_parts.append(("="*80 + "\n\n", "header"))
-            
             # Show diff for each locale with mismatch
             for locale in sorted(entry['term_values'].keys()):
                 locale_lower = locale.lower()
@@ -2393,12 +2671,12 @@ class DecidimTranslationGUI:
                 # Find matching language from any XLIFF file
                 xliff_value = None
                 xliff_label = "XLIFF"
-                for file_path, langs in self.crowdin_languages.items():
-                    if locale_lower == langs.get('source', '').lower():
+                for source_lower, target_lower in self.crowdin_languages_lower.values():
+                    if locale_lower == source_lower:
                         xliff_value = entry['crowdin_source']
                         xliff_label = "XLIFF (source)"
                         break
-                    elif locale_lower == langs.get('target', '').lower():
+                    elif locale_lower == target_lower:
                         xliff_value = entry['crowdin_target']
                         xliff_label = "XLIFF (target)"
                         break
@@ -2410,23 +2688,11 @@ class DecidimTranslationGUI:
                     elif entry['crowdin_target']:
                         xliff_value = entry['crowdin_target']
                         xliff_label = "XLIFF (target)"
-                else:
-                    continue
+                    else:
+                        continue
                 
-                content_parts.append((f"Locale ({locale}):\n", None))
-                content_parts.append((f"  {xliff_label}:  {xliff_value}\n", "removed"))
-                content_parts.append((f"  Customizer:     {term_value}\n", "added"))
-                content_parts.append(("\n", None))
-        
-        # Insert all content at once
-        for text, tag in content_parts:
-            if tag:
-                self.diff_text.insert(tk.END, text, tag)
-            else:
-                self.diff_text.insert(tk.END, text)
-        
-        # Reset to read-only state
-        self.diff_text.config(state=tk.DISABLED)
+                insert("", tk.END, values=(key, locale, xliff_label, xliff_value), tags=("removed",))
+                insert("", tk.END, values=(key, locale, "Customizer", term_value), tags=("added",))
                 
     def update_edit_view(self):
         # Clear existing items efficiently
@@ -2447,11 +2713,11 @@ class DecidimTranslationGUI:
                 # Determine which XLIFF value to show
                 # Find matching language from any XLIFF file
                 xliff_value = None
-                for file_path, langs in self.crowdin_languages.items():
-                    if locale_lower == langs.get('source', '').lower():
+                for source_lower, target_lower in self.crowdin_languages_lower.values():
+                    if locale_lower == source_lower:
                         xliff_value = entry['crowdin_source']
                         break
-                    elif locale_lower == langs.get('target', '').lower():
+                    elif locale_lower == target_lower:
                         xliff_value = entry['crowdin_target']
                         break
                 if xliff_value is None:
@@ -2491,7 +2757,7 @@ class DecidimTranslationGUI:
         edit_dialog.title("Edit Translation")
         edit_dialog.geometry("600x300")
         
-        ttk.Label(edit_dialog, text=f"Key: {current_values[0]}", font=Font(weight="bold")).pack(pady=5)
+        ttk.Label(edit_dialog, text=f"Key: {current_values[0]}", font=FONT_BOLD).pack(pady=5)
         ttk.Label(edit_dialog, text=f"Locale: {current_values[1]}").pack()
         
         ttk.Label(edit_dialog, text="Current Value:").pack(anchor=tk.W, padx=20, pady=(10, 5))
@@ -2528,7 +2794,7 @@ class DecidimTranslationGUI:
                 # Save each file individually
                 saved_files = []
                 for file_path in self.term_customizer_files:
-                    file_mismatches = self.mismatched_entries_per_file.get(file_path, {})
+                    file_mismatches = self.mismatched_entries_per_file.get(file_path, _EMPTY_MAP)
                     if not file_mismatches:
                         continue
                     
@@ -2591,7 +2857,7 @@ class DecidimTranslationGUI:
                 seen_keys = set()
                 
                 for file_path in self.term_customizer_files:
-                    file_mismatches = self.mismatched_entries_per_file.get(file_path, {})
+                    file_mismatches = self.mismatched_entries_per_file.get(file_path, _EMPTY_MAP)
                     for key, entry in file_mismatches.items():
                         for locale in entry['term_values'].keys():
                             item_key = (key, locale)
@@ -2663,23 +2929,20 @@ class DecidimTranslationGUI:
         
         try:
             # Collect all entries for keys to delete
+            # Plain (key, locale, value) tuples, csv.writer skips DictWriter's per-row dict handling
             output_rows = []
-            for key in self.keys_to_delete:
+            all_file_data = list(self.term_customizer_file_data.values())
+            for key in sorted(self.keys_to_delete):
                 # Get all locales for this key from all files
-                for term_file_path, file_data in self.term_customizer_file_data.items():
-                    if key in file_data:
-                        for locale, value in file_data[key].items():
-                            output_rows.append({
-                                'key': key,
-                                'locale': locale,
-                                'value': value
-                            })
+                for file_data in all_file_data:
+                    locales = file_data.get(key)
+                    if locales:
+                        output_rows.extend((key, locale, value) for locale, value in locales.items())
             
             # Write to file
             with open(file_path, mode='w', newline='', encoding='utf-8') as file:
-                fieldnames = ['key', 'locale', 'value']
-                writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=';')
-                writer.writeheader()
+                writer = csv.writer(file, delimiter=';')
+                writer.writerow(('key', 'locale', 'value'))
                 writer.writerows(output_rows)
             
             messagebox.showinfo("Success", 
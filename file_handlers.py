@@ -6,10 +6,87 @@ Handles XLIFF and CSV file loading and saving operations.
 
 import csv
 import os
+import sys
 import xml.etree.ElementTree as ET
+from collections import defaultdict
 from datetime import datetime
 from tkinter import messagebox
 
+try:
+    # Optional: multi-threaded C CSV parser, the csv module is used when not installed
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+
+_CSV_COLUMNS = ('key', 'locale', 'value')
+_CSV_READ_BUFFER_SIZE = 8 * 1024 * 1024  # Few large reads instead of many 8 KiB ones
+# Larger files are read by pyarrow in batches instead of as one table
+_CSV_STREAM_THRESHOLD = 200 * 1024 * 1024
+_CSV_STREAM_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def _arrow_csv_options():
+    """Parse and convert options for reading Term Customizer CSV files with pyarrow"""
+    return {
+        'parse_options': pa_csv.ParseOptions(delimiter=';', newlines_in_values=True),
+        'convert_options': pa_csv.ConvertOptions(
+            include_columns=list(_CSV_COLUMNS),
+            include_missing_columns=True,  # Missing columns come back as nulls
+            column_types={name: pa.string() for name in _CSV_COLUMNS}),
+    }
+
+
+def _read_csv_rows_arrow(file_path):
+    """Read (key, locale, value) rows with pyarrow, or None when the csv module must handle the file"""
+    try:
+        table = pa_csv.read_csv(file_path, **_arrow_csv_options())
+    except pa.ArrowException:
+        # Empty file, truncated rows, ...: the csv module is more lenient
+        return None
+    return zip(*(table.column(name).to_pylist() for name in _CSV_COLUMNS))
+
+
+def _stream_csv_rows_arrow(file_path):
+    """Yield (key, locale, value) rows with pyarrow, one record batch in memory at a time
+    
+    Raises pa.ArrowException on malformed input, possibly after rows were yielded.
+    """
+    reader = pa_csv.open_csv(file_path, read_options=pa_csv.ReadOptions(block_size=_CSV_STREAM_BLOCK_SIZE),
+                             **_arrow_csv_options())
+    for batch in reader:
+        yield from zip(*(batch.column(name).to_pylist() for name in _CSV_COLUMNS))
+
+
+def _read_csv_rows(file):
+    """Yield (key, locale, value) rows from an open CSV file with the csv module"""
+    # Plain rows with column indices from the header, no dict per row
+    reader = csv.reader(file, delimiter=';')
+    header = next(reader, [])
+    if 'key' not in header or 'locale' not in header:
+        # No row can have a key and locale
+        return
+    key_idx = header.index('key')
+    locale_idx = header.index('locale')
+    if 'value' not in header:
+        min_len = max(key_idx, locale_idx) + 1
+        for row in reader:
+            if len(row) >= min_len:
+                yield row[key_idx], row[locale_idx], ''
+        return
+    
+    value_idx = header.index('value')
+    for row in reader:
+        # Complete rows are the norm, so index first and only handle short rows on failure
+        try:
+            yield row[key_idx], row[locale_idx], row[value_idx]
+        except IndexError:
+            if len(row) > max(key_idx, locale_idx):
+                yield row[key_idx], row[locale_idx], ''  # Truncated before the value column
+            # else: blank or truncated line
+
 
 class FileHandler:
     """Handles file operations for XLIFF and CSV files"""
@@ -37,8 +114,8 @@ class FileHandler:
             target_lang = ''
             
             if file_elem is not None:
-                source_lang = file_elem.get('source-language', 'en').lower()
-                target_lang = file_elem.get('target-language', '').lower()
+                source_lang = sys.intern(file_elem.get('source-language', 'en').lower())
+                target_lang = sys.intern(file_elem.get('target-language', '').lower())
             
             data = {}
             
@@ -50,6 +127,8 @@ class FileHandler:
                 key = trans_unit.get('resname', '')
                 if not key:
                     continue
+                # Keys repeat across XLIFF and CSV files, share one string object
+                key = sys.intern(key)
                 
                 # Get source text
                 source_elem = trans_unit.find(ns_tag('source'))
@@ -75,26 +154,53 @@ class FileHandler:
     def load_csv_file(file_path):
         """Load a CSV file and return data structure"""
         try:
-            file_data = {}
-            file_locales = set()
-            
-            with open(file_path, mode='r', encoding='utf-8') as file:
-                reader = csv.DictReader(file, delimiter=';')
-                for row in reader:
-                    key = row.get('key', '')
-                    value = row.get('value', '')
-                    locale = row.get('locale', '').lower()
-                    if key and locale:
-                        if key not in file_data:
-                            file_data[key] = {}
-                        file_data[key][locale] = value
-                        file_locales.add(locale)
-            
-            return file_data, file_locales
+            if pa_csv is not None:
+                if os.path.getsize(file_path) > _CSV_STREAM_THRESHOLD:
+                    # Peak memory is the dict plus one batch, not the dict plus the whole table
+                    try:
+                        return FileHandler._build_csv_data(_stream_csv_rows_arrow(file_path))
+                    except pa.ArrowException:
+                        pass  # Start over with the csv module below
+                else:
+                    rows = _read_csv_rows_arrow(file_path)
+                    if rows is not None:
+                        return FileHandler._build_csv_data(rows)
+            # newline='' as required by the csv module, so quoted line breaks are kept as written
+            with open(file_path, mode='r', encoding='utf-8', newline='', buffering=_CSV_READ_BUFFER_SIZE) as file:
+                return FileHandler._build_csv_data(_read_csv_rows(file))
             
         except Exception as e:
             raise Exception(f"Error loading CSV file: {str(e)}")
     
+    @staticmethod
+    def _build_csv_data(rows):
+        """Build ({key: {locale: value}}, set of locales) from (key, locale, value) rows
+        
+        Line breaks inside values are normalized to LF, as reading in text mode would.
+        """
+        file_data = defaultdict(dict)  # One lookup per row, no throwaway {} per existing key
+        # {raw locale: interned lowercase locale}, a file only has a handful of distinct locales
+        locale_lower = {}
+        # Local name for the per-row call
+        intern = sys.intern
+        
+        for key, locale, value in rows:
+            if key and locale:
+                lowered = locale_lower.get(locale)
+                if lowered is None:
+                    # Keys and locales repeat across files, share one string object
+                    lowered = locale_lower[locale] = intern(locale.lower())
+                if value is None:
+                    value = ''
+                elif '\r' in value:
+                    # Quoted line breaks are read as written, normalize them like XLIFF text
+                    value = value.replace('\r\n', '\n').replace('\r', '\n')
+                file_data[intern(key)][lowered] = value
+        
+        # Behave like a plain dict for callers: missing keys must not be inserted
+        file_data.default_factory = None
+        return file_data, set(locale_lower.values())
+    
     @staticmethod
     def save_csv_file(output_path, output_rows, fieldnames=None):
         """Save data to a CSV file"""
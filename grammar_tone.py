@@ -4,40 +4,134 @@ Grammar Check and Tone Adjustment for Decidim Translation Customizer
 Handles LLM-based grammar checking and tone adjustment.
 """
 
-import json
+import http.client
+import io
 import re
+import threading
+import time
 import urllib.request
 import urllib.error
+from collections import deque
+from urllib.parse import urlsplit
+
+import json_compat
+from constants import LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE
+
+
+# Placeholder formats, matched separately so overlapping forms are all reported
+_PLACEHOLDER_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'%\{[^}]+\}',  # %{name}
+    r'\{\{[^}]+\}\}',  # {{count}}
+    r'\{[^}]+\}',  # {count}
+    r'%[sd]',  # %s, %d
+    r'%[0-9]+\$[sd]',  # %1$s, %2$d
+    r'%[0-9]+[sd]',  # %1s, %2d
+))
+
+# Idle keep-alive connections per (scheme, host, port), shared by the batch worker threads
+_idle_connections = {}
+_idle_connections_lock = threading.Lock()
+
+
+def _post(url, body, headers, timeout):
+    """POST body to url and return the response body, raising urllib.error exceptions like urlopen
+    
+    Connections are kept open and reused, so only the first request to an API
+    host pays for the TCP and TLS handshakes. Requests through a proxy use urlopen.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError(f"unknown url type: {url!r}")
+    if parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(parts.hostname or ''):
+        request = urllib.request.Request(url, data=body, headers=headers)
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.read()
+    
+    pool_key = (parts.scheme, parts.hostname, parts.port)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    
+    while True:
+        with _idle_connections_lock:
+            idle = _idle_connections.get(pool_key)
+            connection = idle.pop() if idle else None
+        reused = connection is not None
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        
+        try:
+            connection.request('POST', path, body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except Exception as e:
+            connection.close()
+            if reused and isinstance(e, ConnectionError):
+                continue  # The server closed the idle connection, retry on a new one
+            if isinstance(e, (OSError, http.client.HTTPException)):
+                raise urllib.error.URLError(e)
+            raise
+        
+        if response.will_close:
+            connection.close()
+        else:
+            with _idle_connections_lock:
+                _idle_connections.setdefault(pool_key, []).append(connection)
+        
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(data))
+        return data
+
+
+class _RateLimiter:
+    """Requests and estimated tokens sent in the last minute, shared by the batch worker threads"""
+    
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._sent = deque()  # (time.monotonic(), tokens) per request of the last minute
+        self._tokens = 0
+        self._condition = threading.Condition()
+    
+    def acquire(self, tokens):
+        """Wait until a request of about tokens tokens fits into the budget of the last minute"""
+        tokens = min(tokens, self.tokens_per_minute)  # An oversized request still has to go out eventually
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0][0] >= 60:
+                    self._tokens -= self._sent.popleft()[1]
+                if len(self._sent) < self.requests_per_minute and self._tokens + tokens <= self.tokens_per_minute:
+                    self._sent.append((now, tokens))
+                    self._tokens += tokens
+                    return
+                # Nothing is released early, so wait for the oldest request to leave the window
+                self._condition.wait(60 - (now - self._sent[0][0]))
+
+
+_rate_limiter = _RateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE)
 
 
 class GrammarToneHandler:
     """Handles grammar checking and tone adjustment via LLM"""
     
+    post = staticmethod(_post)
+    
     @staticmethod
     def extract_placeholders(text):
         """Extract all placeholders from text"""
-        placeholders = []
-        
-        # Pattern for various placeholder formats
-        patterns = [
-            r'%\{[^}]+\}',  # %{name}
-            r'\{\{[^}]+\}\}',  # {{count}}
-            r'\{[^}]+\}',  # {count}
-            r'%[sd]',  # %s, %d
-            r'%[0-9]+\$[sd]',  # %1$s, %2$d
-            r'%[0-9]+[sd]',  # %1s, %2d
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                placeholders.append(match.group())
-        
-        return sorted(set(placeholders))
+        placeholders = set()
+        for pattern in _PLACEHOLDER_PATTERNS:
+            placeholders.update(pattern.findall(text))
+        return sorted(placeholders)
     
     @staticmethod
     def validate_placeholders(original, corrected):
         """Validate that placeholders are preserved"""
+        # Every placeholder has a '%' or '{', most UI strings have neither
+        if '%' not in original and '{' not in original and '%' not in corrected and '{' not in corrected:
+            return True, None
         orig_placeholders = set(GrammarToneHandler.extract_placeholders(original))
         corr_placeholders = set(GrammarToneHandler.extract_placeholders(corrected))
         
@@ -54,28 +148,27 @@ class GrammarToneHandler:
             "temperature": temperature
         }
         
-        req = urllib.request.Request(
-            api_endpoint,
-            data=json.dumps(data).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {api_key}'
-            }
-        )
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {api_key}'
+        }
+        
+        body = json_compat.dumps_bytes(data)
+        # About 4 bytes per token, and the answer is about as long as the prompt
+        _rate_limiter.acquire(len(body) // 2)
         
         try:
-            with urllib.request.urlopen(req, timeout=60) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                
-                if 'choices' not in result or not result['choices']:
-                    raise Exception("Invalid API response: no choices")
-                
-                return result['choices'][0]['message']['content'].strip()
+            result = json_compat.loads(_post(api_endpoint, body, headers, 60))
+            
+            if 'choices' not in result or not result['choices']:
+                raise Exception("Invalid API response: no choices")
+            
+            return result['choices'][0]['message']['content'].strip()
                 
         except urllib.error.HTTPError as e:
             error_body = e.read().decode('utf-8')
             try:
-                error_json = json.loads(error_body)
+                error_json = json_compat.loads(error_body)
                 error_obj = error_json.get('error', {})
                 
                 # Try different error formats
@@ -97,7 +190,7 @@ class GrammarToneHandler:
             raise Exception(detailed_error)
         except urllib.error.URLError as e:
             raise Exception(f"Network error: {str(e)}\n\nPlease check your internet connection and API endpoint URL.")
-        except json.JSONDecodeError as e:
+        except json_compat.JSONDecodeError as e:
             raise Exception(f"Invalid JSON response: {str(e)}\n\nThe API may have returned an unexpected format.")
         except Exception as e:
             # Re-raise with more context if it's already our formatted error
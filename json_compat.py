@@ -0,0 +1,41 @@
+"""
+JSON helpers for Decidim Translation Assistant
+
+Uses orjson or ujson when installed and falls back to the standard json module.
+loads accepts UTF-8 encoded bytes as well as str with every backend.
+"""
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError  # Subclass of json.JSONDecodeError
+
+    def dumps_bytes(obj, indent=False):
+        """Serialize obj to UTF-8 encoded JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    try:
+        import ujson
+
+        loads = ujson.loads
+        JSONDecodeError = getattr(ujson, 'JSONDecodeError', ValueError)
+
+        def dumps_bytes(obj, indent=False):
+            """Serialize obj to UTF-8 encoded JSON"""
+            return ujson.dumps(obj, indent=2 if indent else 0, ensure_ascii=False,
+                               escape_forward_slashes=False).encode('utf-8')
+    except ImportError:
+        import json
+
+        loads = json.loads
+        JSONDecodeError = json.JSONDecodeError
+
+        def dumps_bytes(obj, indent=False):
+            """Serialize obj to UTF-8 encoded JSON"""
+            return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def dumps(obj, indent=False):
+    """Serialize obj to a JSON string"""
+    return dumps_bytes(obj, indent).decode('utf-8')
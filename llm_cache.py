@@ -0,0 +1,66 @@
+"""
+LLM Answer Cache for Decidim Translation Assistant
+
+Keeps grammar and tone answers per value across sessions, so re-running a
+check on an updated file only sends the strings that changed.
+"""
+
+import hashlib
+import os
+import sqlite3
+
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class LLMAnswerCache:
+    """Persistent {(scope, value): answer} store in a SQLite file, used from the Tk thread only"""
+    
+    def __init__(self, path=None):
+        self.path = path or os.path.join(os.path.expanduser("~"), ".decidim_translation_llm_cache.sqlite3")
+        self._connection = None
+    
+    @staticmethod
+    def make_scope(api_endpoint, model, temperature, system_prompt):
+        """Digest of everything besides the value that an answer depends on
+        
+        The system prompt holds the language, the tone mode and the prompt wording,
+        so changing any of them (or the model) starts from an empty scope.
+        """
+        scope = f"{api_endpoint}\0{model}\0{temperature}\0{system_prompt}"
+        return hashlib.blake2b(scope.encode('utf-8'), digest_size=16).digest()
+    
+    def _connect(self):
+        """Open the cache file on first use"""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute("CREATE TABLE IF NOT EXISTS answers "
+                               "(scope BLOB, value TEXT, answer TEXT, PRIMARY KEY (scope, value))")
+            self._connection = connection
+        return self._connection
+    
+    def get_many(self, scope, values):
+        """Return {value: answer} for the values that have a stored answer"""
+        found = {}
+        try:
+            connection = self._connect()
+            for i in range(0, len(values), _LOOKUP_CHUNK_SIZE):
+                chunk = values[i:i + _LOOKUP_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                found.update(connection.execute(
+                    f"SELECT value, answer FROM answers WHERE scope = ? AND value IN ({placeholders})",
+                    (scope, *chunk)))
+        except sqlite3.Error:
+            pass  # The cache only saves requests, never fail a check because of it
+        return found
+    
+    def put_many(self, scope, answers):
+        """Store (value, answer) pairs"""
+        try:
+            connection = self._connect()
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO answers VALUES (?, ?, ?)",
+                                       ((scope, value, answer) for value, answer in answers))
+        except sqlite3.Error:
+            pass
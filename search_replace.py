@@ -49,6 +49,47 @@ class SearchReplaceHandler:
             else:
                 # Case-insensitive replace
                 return re.sub(re.escape(search_term), replace_term, text, flags=re.IGNORECASE)
-
-
-
+    
+    @staticmethod
+    def build_replacer(search_term, replace_term, case_sensitive, whole_word):
+        """Build a replace(text) -> (new_text, count) function for one search
+        
+        The pattern is compiled once. Replacements are the same as replace_text()
+        with the same options, and count (0 when nothing matched) comes from the
+        same pass, so no separate should_replace() scan is needed.
+        """
+        if whole_word or not case_sensitive:
+            escaped = re.escape(search_term)
+            if whole_word:
+                # Use word boundaries for whole word matching
+                escaped = r'\b' + escaped + r'\b'
+            pattern = re.compile(escaped, 0 if case_sensitive else re.IGNORECASE)
+            
+            def replace(text):
+                return pattern.subn(replace_term, text)
+        else:
+            # Plain substring search, no regex needed
+            def replace(text):
+                count = text.count(search_term)
+                if not count:
+                    return text, 0
+                return text.replace(search_term, replace_term), count
+        
+        return replace
+    
+    @staticmethod
+    def find_replacements(file_data, field, replace):
+        """Return [(key, old_value, new_value)] for the entries whose field value changes
+        
+        file_data maps keys to dicts: XLIFF entries ('source'/'target') or Term
+        Customizer locales. replace comes from build_replacer(). Touches no shared
+        state, so files can be scanned in worker threads.
+        """
+        found = []
+        for key, entry in file_data.items():
+            value = entry.get(field)
+            if value:
+                new_value, count = replace(value)
+                if count and new_value != value:
+                    found.append((key, value, new_value))
+        return found
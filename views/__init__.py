@@ -6,6 +6,7 @@ from .compare_view import CompareView
 from .edit_view import EditView
 from .search_replace_view import SearchReplaceView
 from .grammar_check_view import GrammarCheckView
+from .virtual_checklist import VirtualChecklist
 
-__all__ = ['CompareView', 'EditView', 'SearchReplaceView', 'GrammarCheckView']
+__all__ = ['CompareView', 'EditView', 'SearchReplaceView', 'GrammarCheckView', 'VirtualChecklist']
 
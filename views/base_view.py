@@ -5,6 +5,10 @@ Base view class for tab views
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from tkinter.font import Font
+from constants import (
+    TAG_HEADER, TAG_SUBHEADER, TAG_NUMBER, TAG_WARNING, TAG_ERROR,
+    FONT_STATS_BOLD, FONT_STATS_HEADER
+)
 
 
 class BaseView:
@@ -21,6 +25,7 @@ class BaseView:
         self.parent_frame = parent_frame
         self.app = app
         self.container = None
+        self._stats_tags_configured = False
     
     def create(self):
         """Create the view UI - to be implemented by subclasses"""
@@ -30,6 +35,18 @@ class BaseView:
         """Update the view with current data - to be implemented by subclasses"""
         pass
     
+    def configure_stats_tags(self, text_widget):
+        """Configure the statistics highlighting tags, only the first time it is called"""
+        if self._stats_tags_configured:
+            return
+        # Named fonts, so Tk doesn't parse a font description for every tag
+        text_widget.tag_config(TAG_HEADER, font=FONT_STATS_HEADER, foreground="navy")
+        text_widget.tag_config(TAG_SUBHEADER, font=FONT_STATS_BOLD, foreground="darkblue")
+        text_widget.tag_config(TAG_NUMBER, font=FONT_STATS_BOLD, foreground="darkgreen")
+        text_widget.tag_config(TAG_WARNING, foreground="orange")
+        text_widget.tag_config(TAG_ERROR, foreground="red")
+        self._stats_tags_configured = True
+    
     def destroy(self):
         """Clean up the view"""
         if self.container:
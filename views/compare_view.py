@@ -4,12 +4,10 @@ Compare View for Decidim Translation Assistant
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from tkinter.font import Font
 from .base_view import BaseView
 from constants import (
-    TAG_HEADER, TAG_SUBHEADER, TAG_NUMBER, TAG_WARNING, TAG_ERROR,
     TAG_ADDED, TAG_REMOVED, COLOR_ADDED_BG, COLOR_REMOVED_BG,
-    FONT_COURIER, FONT_ARIAL, FONT_ARIAL_BOLD, FONT_ARIAL_HEADER
+    FONT_COURIER, FONT_ARIAL, FONT_BOLD
 )
 
 
@@ -38,7 +36,7 @@ class CompareView(BaseView):
         logic_row = ttk.Frame(settings_frame)
         logic_row.pack(fill=tk.X, pady=2)
         
-        ttk.Label(logic_row, text="Comparison Logic:", font=Font(weight="bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(logic_row, text="Comparison Logic:", font=FONT_BOLD).pack(side=tk.LEFT, padx=5)
         
         # Require term customizer value to exist
         self.require_term_value_var = tk.BooleanVar(value=True)
@@ -62,7 +60,7 @@ class CompareView(BaseView):
         save_row = ttk.Frame(settings_frame)
         save_row.pack(fill=tk.X, pady=2)
         
-        ttk.Label(save_row, text="Save Options:", font=Font(weight="bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(save_row, text="Save Options:", font=FONT_BOLD).pack(side=tk.LEFT, padx=5)
         
         self.save_mode_var = tk.StringVar(value="individual")
         individual_radio = ttk.Radiobutton(save_row, text="Save Individual Files", 
@@ -101,30 +99,52 @@ class CompareView(BaseView):
         diff_container = ttk.LabelFrame(paned, text="Diff View", padding="5")
         paned.add(diff_container, weight=1)
         
-        self.diff_text = scrolledtext.ScrolledText(diff_container, wrap=tk.NONE, 
-                                                   font=FONT_COURIER)
-        self.diff_text.pack(fill=tk.BOTH, expand=True)
+        # Treeview (one row per line) instead of a Text widget, so large diffs don't
+        # need the whole buffer laid out again on every update/resize
+        diff_tree_frame = ttk.Frame(diff_container)
+        diff_tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        diff_vsb = ttk.Scrollbar(diff_tree_frame, orient="vertical")
+        diff_hsb = ttk.Scrollbar(diff_tree_frame, orient="horizontal")
+        
+        columns = ("key", "locale", "side", "value")
+        self.diff_tree = ttk.Treeview(diff_tree_frame, columns=columns, show="headings",
+                                      yscrollcommand=diff_vsb.set, xscrollcommand=diff_hsb.set)
+        
+        diff_vsb.config(command=self.diff_tree.yview)
+        diff_hsb.config(command=self.diff_tree.xview)
+        
+        self.diff_tree.heading("key", text="Key")
+        self.diff_tree.heading("locale", text="Locale")
+        self.diff_tree.heading("side", text="Side")
+        self.diff_tree.heading("value", text="Value")
+        
+        self.diff_tree.column("key", width=200)
+        self.diff_tree.column("locale", width=60)
+        self.diff_tree.column("side", width=110)
+        self.diff_tree.column("value", width=400)
+        
+        self.diff_tree.grid(row=0, column=0, sticky="nsew")
+        diff_vsb.grid(row=0, column=1, sticky="ns")
+        diff_hsb.grid(row=1, column=0, sticky="ew")
+        
+        diff_tree_frame.grid_rowconfigure(0, weight=1)
+        diff_tree_frame.grid_columnconfigure(0, weight=1)
         
         # Configure tags for diff highlighting
-        self.diff_text.tag_config(TAG_ADDED, foreground="green", background=COLOR_ADDED_BG)
-        self.diff_text.tag_config(TAG_REMOVED, foreground="red", background=COLOR_REMOVED_BG)
-        self.diff_text.tag_config(TAG_HEADER, foreground="blue", font=Font(family="Courier", size=10, weight="bold"))
-        self.diff_text.config(state=tk.DISABLED)
+        self.diff_tree.tag_configure(TAG_ADDED, foreground="green", background=COLOR_ADDED_BG, font=FONT_COURIER)
+        self.diff_tree.tag_configure(TAG_REMOVED, foreground="red", background=COLOR_REMOVED_BG, font=FONT_COURIER)
         
         # Right pane: Statistics
         stats_container = ttk.LabelFrame(paned, text="Statistics", padding="5")
         paned.add(stats_container, weight=1)
         
         self.stats_text = scrolledtext.ScrolledText(stats_container, wrap=tk.WORD, 
-                                                    font=FONT_ARIAL)
+                                                    font=FONT_ARIAL, undo=False)
         self.stats_text.pack(fill=tk.BOTH, expand=True)
         
         # Configure tags for statistics highlighting
-        self.stats_text.tag_config(TAG_HEADER, font=FONT_ARIAL_HEADER, foreground="navy")
-        self.stats_text.tag_config(TAG_SUBHEADER, font=FONT_ARIAL_BOLD, foreground="darkblue")
-        self.stats_text.tag_config(TAG_NUMBER, font=FONT_ARIAL_BOLD, foreground="darkgreen")
-        self.stats_text.tag_config(TAG_WARNING, foreground="orange")
-        self.stats_text.tag_config(TAG_ERROR, foreground="red")
+        self.configure_stats_tags(self.stats_text)
         self.stats_text.config(state=tk.DISABLED)
         
         # Store references in app for access from main class
@@ -134,6 +154,6 @@ class CompareView(BaseView):
         self.app.case_sensitive_var = self.case_sensitive_var
         self.app.save_mode_var = self.save_mode_var
         self.app.output_suffix_var = self.output_suffix_var
-        self.app.diff_text = self.diff_text
+        self.app.diff_tree = self.diff_tree
         self.app.stats_text = self.stats_text
 
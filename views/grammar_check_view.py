@@ -4,13 +4,11 @@ Grammar Check & Tone Adjustment View for Decidim Translation Assistant
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from tkinter.font import Font
 from .base_view import BaseView
 from constants import (
-    TAG_HEADER, TAG_SUBHEADER, TAG_NUMBER, TAG_WARNING, TAG_ERROR,
-    TAG_ORIGINAL, TAG_CORRECTED,
+    TAG_HEADER, TAG_ERROR, TAG_ORIGINAL, TAG_CORRECTED,
     COLOR_ORIGINAL_BG, COLOR_CORRECTED_BG,
-    FONT_COURIER, FONT_ARIAL, FONT_ARIAL_BOLD, FONT_ARIAL_HEADER,
+    FONT_COURIER, FONT_ARIAL, FONT_BOLD,
     DEFAULT_API_ENDPOINT, DEFAULT_API_MODEL, DEFAULT_BATCH_SIZE, DEFAULT_TEMPERATURE
 )
 
@@ -68,19 +66,19 @@ class GrammarCheckView(BaseView):
         file_selection_frame = ttk.Frame(settings_box)
         file_selection_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(file_selection_frame, text="Select Files:", font=Font(weight="bold")).pack(anchor=tk.W)
+        ttk.Label(file_selection_frame, text="Select Files:", font=FONT_BOLD).pack(anchor=tk.W)
         
         file_checkboxes_frame = ttk.Frame(file_selection_frame)
         file_checkboxes_frame.pack(fill=tk.X, pady=5)
         
         # XLIFF files checkboxes (will be populated dynamically)
-        ttk.Label(file_checkboxes_frame, text="XLIFF Files:", font=Font(weight="bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(file_checkboxes_frame, text="XLIFF Files:", font=FONT_BOLD).pack(side=tk.LEFT, padx=5)
         self.gc_crowdin_file_vars = {}  # {file_path: BooleanVar}
         self.gc_crowdin_checkboxes_frame = ttk.Frame(file_checkboxes_frame)
         self.gc_crowdin_checkboxes_frame.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
         
         # Term Customizer files checkboxes (will be populated dynamically)
-        ttk.Label(file_checkboxes_frame, text="Term Customizer Files:", font=Font(weight="bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(file_checkboxes_frame, text="Term Customizer Files:", font=FONT_BOLD).pack(side=tk.LEFT, padx=5)
         self.gc_term_file_vars = {}  # {file_path: BooleanVar}
         self.gc_term_checkboxes_frame = ttk.Frame(file_checkboxes_frame)
         self.gc_term_checkboxes_frame.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
@@ -115,6 +113,12 @@ class GrammarCheckView(BaseView):
                                textvariable=self.gc_temperature_var, width=10, format="%.1f")
         temp_spin.pack(side=tk.LEFT, padx=5)
         
+        # Answer cache (off sends every value again, e.g. after a model update)
+        self.gc_cache_enabled_var = tk.BooleanVar(value=True)
+        cache_check = ttk.Checkbutton(options_row, text="Reuse cached answers", 
+                       variable=self.gc_cache_enabled_var)
+        cache_check.pack(side=tk.LEFT, padx=5)
+        
         # Tone adjustment section
         tone_section = ttk.LabelFrame(self.container, text="Tone Adjustments", padding="10")
         tone_section.pack(fill=tk.X, pady=5)
@@ -159,7 +163,7 @@ class GrammarCheckView(BaseView):
         # Configure preview text tags
         self.grammar_preview_text.tag_config(TAG_ORIGINAL, background=COLOR_ORIGINAL_BG, foreground="black")
         self.grammar_preview_text.tag_config(TAG_CORRECTED, background=COLOR_CORRECTED_BG, foreground="black")
-        self.grammar_preview_text.tag_config(TAG_HEADER, font=Font(weight="bold"), foreground="navy")
+        self.grammar_preview_text.tag_config(TAG_HEADER, font=FONT_BOLD, foreground="navy")
         self.grammar_preview_text.tag_config(TAG_ERROR, foreground="red")
         
         # Right pane: Statistics
@@ -167,15 +171,11 @@ class GrammarCheckView(BaseView):
         paned.add(stats_container, weight=1)
         
         self.gc_stats_text = scrolledtext.ScrolledText(stats_container, wrap=tk.WORD, 
-                                                       font=FONT_ARIAL)
+                                                       font=FONT_ARIAL, undo=False)
         self.gc_stats_text.pack(fill=tk.BOTH, expand=True)
         
         # Configure tags for statistics highlighting
-        self.gc_stats_text.tag_config(TAG_HEADER, font=FONT_ARIAL_HEADER, foreground="navy")
-        self.gc_stats_text.tag_config(TAG_SUBHEADER, font=FONT_ARIAL_BOLD, foreground="darkblue")
-        self.gc_stats_text.tag_config(TAG_NUMBER, font=FONT_ARIAL_BOLD, foreground="darkgreen")
-        self.gc_stats_text.tag_config(TAG_WARNING, foreground="orange")
-        self.gc_stats_text.tag_config(TAG_ERROR, foreground="red")
+        self.configure_stats_tags(self.gc_stats_text)
         self.gc_stats_text.config(state=tk.DISABLED)
         
         # Store references in app
@@ -186,10 +186,13 @@ class GrammarCheckView(BaseView):
         self.app.gc_term_file_vars = self.gc_term_file_vars
         self.app.gc_crowdin_checkboxes_frame = self.gc_crowdin_checkboxes_frame
         self.app.gc_term_checkboxes_frame = self.gc_term_checkboxes_frame
+        self.app._gc_crowdin_checkbuttons = {}  # {file_path: (Checkbutton, BooleanVar)}, reused across updates
+        self.app._gc_term_checkbuttons = {}  # {file_path: (Checkbutton, BooleanVar)}, reused across updates
         self.app.gc_language_var = self.gc_language_var
         self.app.gc_language_combo = self.gc_language_combo
         self.app.gc_batch_size_var = self.gc_batch_size_var
         self.app.gc_temperature_var = self.gc_temperature_var
+        self.app.gc_cache_enabled_var = self.gc_cache_enabled_var
         self.app.gc_tone_var = self.gc_tone_var
         self.app.grammar_preview_text = self.grammar_preview_text
         self.app.gc_stats_text = self.gc_stats_text
@@ -197,12 +200,18 @@ class GrammarCheckView(BaseView):
         # Initialize grammar check and tone adjustment data
         self.app.grammar_corrections = {}  # {file_path: {key: {locale: {'original': value, 'corrected': value}}}}
         self.app.tone_corrections = {}  # {file_path: {key: {locale: {'original': value, 'corrected': value}}}}
+        self.app.grammar_correction_counts = {}  # {file_path: number of grammar corrections}
+        self.app.tone_correction_counts = {}  # {file_path: number of tone adjustments}
+        self.app._grammar_progress_parts = []  # [(text, tag)] queued for the preview
+        self.app._grammar_progress_flushed = 0.0  # time.monotonic() of the last progress redraw
         self.app._gc_language_update_scheduled = None  # For debouncing language updates
+        self.app._gc_update_generation = 0  # Incremented per scheduled update, stale callbacks are ignored
         
         # Cache for language lists to avoid repeated expensive operations
-        self.app._gc_languages_cache = None
-        self.app._gc_languages_cache_valid = False
+        self.app._gc_applied_languages = None  # Memoized list last shown in the combo
+        self.app._gc_languages_memo = {}  # {selected term files: sorted languages}
         self.app.gc_direct_files = {}  # {file_path: {key: {locale: value}}} - Files loaded directly for grammar check
+        self.app.gc_direct_file_locales = {}  # {file_path: frozenset of locales} for gc_direct_files
         
         # Initialize file selection lazily (only when tab is accessed)
         self.app.root.after_idle(self.app.update_gc_file_selection)
@@ -2,13 +2,13 @@
 Search & Replace View for Decidim Translation Assistant
 """
 
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from tkinter.font import Font
 from .base_view import BaseView
 from constants import (
     TAG_MATCH, TAG_REPLACEMENT, TAG_HEADER,
-    COLOR_MATCH_BG, COLOR_REPLACEMENT_BG, FONT_COURIER
+    COLOR_MATCH_BG, COLOR_REPLACEMENT_BG, FONT_COURIER, FONT_BOLD
 )
 
 
@@ -28,19 +28,19 @@ class SearchReplaceView(BaseView):
         file_selection_frame = ttk.Frame(top_section)
         file_selection_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(file_selection_frame, text="Select Files:", font=Font(weight="bold")).pack(anchor=tk.W)
+        ttk.Label(file_selection_frame, text="Select Files:", font=FONT_BOLD).pack(anchor=tk.W)
         
         file_checkboxes_frame = ttk.Frame(file_selection_frame)
         file_checkboxes_frame.pack(fill=tk.X, pady=5)
         
         # XLIFF files checkboxes (will be populated dynamically)
-        ttk.Label(file_checkboxes_frame, text="XLIFF Files:", font=Font(weight="bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(file_checkboxes_frame, text="XLIFF Files:", font=FONT_BOLD).pack(side=tk.LEFT, padx=5)
         self.sr_crowdin_file_vars = {}  # {file_path: BooleanVar}
         self.sr_crowdin_checkboxes_frame = ttk.Frame(file_checkboxes_frame)
         self.sr_crowdin_checkboxes_frame.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
         
         # Term Customizer files checkboxes (will be populated dynamically)
-        ttk.Label(file_checkboxes_frame, text="Term Customizer Files:", font=Font(weight="bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(file_checkboxes_frame, text="Term Customizer Files:", font=FONT_BOLD).pack(side=tk.LEFT, padx=5)
         self.sr_term_file_vars = {}  # {file_path: BooleanVar}
         self.sr_term_checkboxes_frame = ttk.Frame(file_checkboxes_frame)
         self.sr_term_checkboxes_frame.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
@@ -108,13 +108,15 @@ class SearchReplaceView(BaseView):
         # Configure preview text tags
         self.preview_text.tag_config(TAG_MATCH, background=COLOR_MATCH_BG, foreground="black")
         self.preview_text.tag_config(TAG_REPLACEMENT, background=COLOR_REPLACEMENT_BG, foreground="black")
-        self.preview_text.tag_config(TAG_HEADER, font=Font(weight="bold"), foreground="navy")
+        self.preview_text.tag_config(TAG_HEADER, font=FONT_BOLD, foreground="navy")
         
         # Store references in app
         self.app.sr_crowdin_file_vars = self.sr_crowdin_file_vars
         self.app.sr_term_file_vars = self.sr_term_file_vars
         self.app.sr_crowdin_checkboxes_frame = self.sr_crowdin_checkboxes_frame
         self.app.sr_term_checkboxes_frame = self.sr_term_checkboxes_frame
+        self.app._sr_crowdin_checkbuttons = {}  # {file_path: (Checkbutton, BooleanVar)}, reused across updates
+        self.app._sr_term_checkbuttons = {}  # {file_path: (Checkbutton, BooleanVar)}, reused across updates
         self.app.search_term_var = self.search_term_var
         self.app.replace_term_var = self.replace_term_var
         self.app.sr_language_var = self.sr_language_var
@@ -124,14 +126,17 @@ class SearchReplaceView(BaseView):
         self.app.preview_text = self.preview_text
         
         # Initialize replacement data storage
-        self.app.replacement_preview = {}  # {file_path: {key: {locale: {'old': value, 'new': value}}}}
+        self.app.replacement_preview_rows = []  # [(file_path, key, locale, old_value, new_value)]
+        self.app.replacement_preview_index = {}  # {file_path: [row indices]}
         self.app._sr_update_scheduled = None  # For debouncing language updates
+        self.app._sr_update_generation = 0  # Incremented per scheduled update, stale callbacks are ignored
         self.app.sr_direct_files = {}  # {file_path: {key: {locale: value}}} - Files loaded directly for search/replace
-        self.app.last_sr_output_files = []  # List of most recently created output files for easy reloading
+        self.app.sr_direct_file_locales = {}  # {file_path: frozenset of locales} for sr_direct_files
+        self.app.last_sr_output_files = deque(maxlen=10)  # Most recently created output files for easy reloading
         
         # Cache for language lists to avoid repeated expensive operations
-        self.app._sr_languages_cache = None
-        self.app._sr_languages_cache_valid = False
+        self.app._sr_applied_languages = None  # Memoized list last shown in the combo
+        self.app._sr_languages_memo = {}  # {(selected XLIFF files, selected term files): sorted languages}
         
         # Initialize file selection lazily (only when tab is accessed)
         # Don't call update functions here - they'll be called when needed
@@ -0,0 +1,97 @@
+"""
+Scrollable file checklist for long file lists
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualChecklist:
+    """Vertical checklist in a scrollable canvas that only creates the checkbuttons scrolled into view"""
+    
+    ROW_HEIGHT = 24
+    VISIBLE_ROWS = 6
+    
+    def __init__(self, parent):
+        """
+        Initialize the checklist (not shown until show() is called)
+        
+        Args:
+            parent: The frame the checklist is packed into
+        """
+        self.frame = ttk.Frame(parent)
+        self.canvas = tk.Canvas(self.frame, height=self.ROW_HEIGHT * self.VISIBLE_ROWS,
+                                highlightthickness=0, yscrollincrement=self.ROW_HEIGHT)
+        scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scroll)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.canvas.bind("<Configure>", lambda event: self._materialize())
+        self.canvas.bind("<MouseWheel>", lambda event: self._on_scroll("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self._on_scroll("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self._on_scroll("scroll", 1, "units"))
+        
+        self.is_shown = False
+        self._entries = []  # [(file_path, label)] in display order
+        self._checkbuttons = {}  # {file_path: Checkbutton}, created on first view and kept
+        self._placed = set()  # File paths with a canvas window at their current row
+        self._file_vars = {}
+        self._command = None
+    
+    def show(self):
+        """Pack the checklist into its parent"""
+        self.frame.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.is_shown = True
+    
+    def hide(self):
+        """Unpack the checklist, keeping its checkbuttons for reuse"""
+        self.frame.pack_forget()
+        self.is_shown = False
+    
+    def set_entries(self, entries, file_vars, command):
+        """Show one row per (file_path, label) entry, checked state taken from file_vars"""
+        # Drop checkbuttons of files no longer listed
+        listed = {file_path for file_path, _ in entries}
+        for file_path in list(self._checkbuttons):
+            if file_path not in listed:
+                self._checkbuttons.pop(file_path).destroy()
+        
+        # A file keeps its var and the command is the same bound method, only the label can change
+        for file_path, label in entries:
+            check = self._checkbuttons.get(file_path)
+            if check is not None:
+                check.config(text=label)
+        
+        # Rows may have moved, so windows are recreated for the visible range only
+        self.canvas.delete("all")
+        self._placed.clear()
+        self._entries = list(entries)
+        self._file_vars = file_vars
+        self._command = command
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self._entries) * self.ROW_HEIGHT))
+        self._materialize()
+    
+    def _on_scroll(self, *args):
+        """Scroll the canvas, then create the rows that came into view"""
+        self.canvas.yview(*args)
+        self._materialize()
+    
+    def _materialize(self):
+        """Place checkbuttons for the rows in the visible part of the canvas"""
+        if not self._entries:
+            return
+        first = max(0, int(self.canvas.canvasy(0)) // self.ROW_HEIGHT)
+        last = min(len(self._entries), int(self.canvas.canvasy(self.canvas.winfo_height())) // self.ROW_HEIGHT + 1)
+        for index in range(first, last):
+            file_path, label = self._entries[index]
+            if file_path in self._placed:
+                continue
+            check = self._checkbuttons.get(file_path)
+            if check is None:
+                check = ttk.Checkbutton(self.canvas, text=label, variable=self._file_vars[file_path],
+                                        command=self._command)
+                self._checkbuttons[file_path] = check
+            self.canvas.create_window(5, index * self.ROW_HEIGHT, window=check, anchor="nw")
+            self._placed.add(file_path)
+